@@ -0,0 +1,59 @@
+"""
+Benchmark of Records loading from gzipped CSV files versus loading from
+a memory-mapped binary directory written by Records.write_binary.
+
+USAGE: (taxcalc-dev) Tax-Calculator$ python benchmarks/bench_binary_load.py
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_binary_load.py
+# pylint --disable=locally-disabled bench_binary_load.py
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import taxcalc as tc
+
+
+def main():
+    """
+    Time loading of CPS Records from CSV and binary files and write results.
+    """
+    parser = argparse.ArgumentParser(
+        description='Time loading of CPS Records from CSV and binary files.'
+    )
+    parser.add_argument('--loads', type=int, default=3,
+                        help='number of timed loads of each kind')
+    args = parser.parse_args()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        bdir = os.path.join(tmpdir, 'cps_binary')
+        start = time.perf_counter()
+        tc.Records.write_binary(
+            bdir,
+            data=os.path.join(tc.Records.CODE_PATH, 'cps.csv.gz'),
+            start_year=tc.Records.CPSCSV_YEAR,
+            weights=os.path.join(tc.Records.CODE_PATH, 'cps_weights.csv.gz')
+        )
+        secs = time.perf_counter() - start
+        sys.stdout.write(f'write_binary (one time): {secs:.2f} s\n')
+        for name, load in [
+                ('cps_constructor', tc.Records.cps_constructor),
+                ('binary_constructor',
+                 lambda: tc.Records.binary_constructor(bdir))
+        ]:
+            start = time.perf_counter()
+            for _ in range(args.loads):
+                rec = load()
+            secs = (time.perf_counter() - start) / args.loads
+            sys.stdout.write(f'{name}: {secs:.2f} s per load '
+                             f'({rec.array_length} records)\n')
+    finally:
+        shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Micro-benchmark of the per-call overhead of the iterate_jit wrapper.
+
+Times repeated Calculator.calc_all() calls on a one-row TAXSIM-style
+Records object, where nearly all of the execution time is per-call
+Python overhead rather than per-record arithmetic.
+
+USAGE: (taxcalc-dev) Tax-Calculator$ python benchmarks/bench_iterate_jit.py
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_iterate_jit.py
+# pylint --disable=locally-disabled bench_iterate_jit.py
+
+import sys
+import time
+import argparse
+import pandas as pd
+import taxcalc as tc
+
+
+def main():
+    """
+    Time calc_all() calls on a one-row Records object and write results.
+    """
+    parser = argparse.ArgumentParser(
+        description='Time calc_all() calls on a one-row Records object.'
+    )
+    parser.add_argument('--calls', type=int, default=200,
+                        help='number of timed calc_all() calls')
+    args = parser.parse_args()
+    data = pd.DataFrame({
+        'RECID': [1], 'MARS': [2], 'XTOT': [3], 'EIC': [1],
+        'e00200': [40000.], 'e00200p': [40000.], 'e00200s': [0.],
+    })
+    rec = tc.Records(data=data, start_year=2020, gfactors=None, weights=None)
+    calc = tc.Calculator(policy=tc.Policy(), records=rec)
+    # first call includes numba compilation, so do not time it
+    start = time.perf_counter()
+    calc.calc_all()
+    first_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        calc.calc_all()
+    msecs_per_call = (time.perf_counter() - start) / args.calls * 1000.
+    sys.stdout.write(f'first calc_all call (with JIT): {first_secs:.1f} s\n')
+    sys.stdout.write(
+        f'later calc_all calls: {msecs_per_call:.2f} ms per call '
+        f'(mean of {args.calls} calls)\n'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Scaling benchmark of multi-threaded Calculator.calc_all() execution.
+
+Times calc_all() calls on the CPS input data (or on a CSV file specified
+with the --data option) using from one thread up to the number of CPU
+cores, for both the unfused and the fused calculations, and checks that
+each multi-threaded result is identical to the single-threaded result.
+
+USAGE: (taxcalc-dev) Tax-Calculator$ python benchmarks/bench_parallel.py
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_parallel.py
+# pylint --disable=locally-disabled bench_parallel.py
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import taxcalc as tc
+
+
+def main():
+    """
+    Time calc_all() calls using 1 to N threads and write results.
+    """
+    parser = argparse.ArgumentParser(
+        description='Time calc_all() calls using 1 to N threads.'
+    )
+    parser.add_argument('--data', default=None,
+                        help='CSV input file (default is CPS input data)')
+    parser.add_argument('--year', type=int, default=2026,
+                        help='calendar year of the calculations')
+    parser.add_argument('--maxthreads', type=int, default=os.cpu_count(),
+                        help='largest number of threads')
+    parser.add_argument('--calls', type=int, default=3,
+                        help='number of timed calc_all() calls per run')
+    args = parser.parse_args()
+    if args.data is None:
+        rec = tc.Records.cps_constructor()
+    else:
+        rec = tc.Records(data=pd.read_csv(args.data), start_year=args.year,
+                         gfactors=None, weights=None)
+    pol = tc.Policy()
+    sys.stdout.write(f'records={rec.array_length} year={args.year}\n')
+    for fused in [False, True]:
+        base = None
+        for nthreads in range(1, args.maxthreads + 1):
+            calc = tc.Calculator(policy=pol, records=rec, fused=fused,
+                                 num_threads=nthreads)
+            calc.advance_to_year(args.year)
+            calc.calc_all()  # first call may include numba compilation
+            start = time.perf_counter()
+            for _ in range(args.calls):
+                calc.calc_all()
+            secs = (time.perf_counter() - start) / args.calls
+            if base is None:
+                base = (secs, calc.array('combined').copy())
+            same = np.array_equal(calc.array('combined'), base[1])
+            sys.stdout.write(
+                f'fused={fused!s:5} threads={nthreads:2d} '
+                f'secs={secs:7.3f} speedup={base[0] / secs:5.2f} '
+                f'identical={same}\n'
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark of Policy.implement_reform applied to each of the JSON reform
+files in the taxcalc/reforms directory.
+
+Times construction of a current-law Policy object and implementation of
+the reform for each reform file (or for the reform files specified on the
+command line) and writes the timings.
+
+USAGE: (taxcalc-dev) Tax-Calculator$ python benchmarks/bench_reforms.py
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_reforms.py
+# pylint --disable=locally-disabled bench_reforms.py
+
+import os
+import sys
+import glob
+import time
+import argparse
+import taxcalc as tc
+
+
+def main():
+    """
+    Time implementation of each reform file and write results.
+    """
+    parser = argparse.ArgumentParser(
+        description='Time Policy.implement_reform for reform files.'
+    )
+    parser.add_argument('reforms', nargs='*',
+                        help='JSON reform files (default is all files in '
+                        'the taxcalc/reforms directory)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='number of timed implementations of each reform')
+    args = parser.parse_args()
+    paths = args.reforms
+    if not paths:
+        paths = sorted(glob.glob(
+            os.path.join(tc.Policy.DEFAULTS_FILE_PATH, 'reforms', '*.json')
+        ))
+    tc.Policy()  # first construction is not timed
+    total_init = 0.
+    total_reform = 0.
+    for path in paths:
+        reform = tc.Policy.read_json_reform(path)
+        init_secs = 0.
+        reform_secs = 0.
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            pol = tc.Policy()
+            init_secs += time.perf_counter() - start
+            start = time.perf_counter()
+            pol.implement_reform(reform)
+            reform_secs += time.perf_counter() - start
+        init_secs /= args.repeats
+        reform_secs /= args.repeats
+        total_init += init_secs
+        total_reform += reform_secs
+        sys.stdout.write(
+            f'{os.path.basename(path):40s} params={len(reform):3d} '
+            f'Policy()={init_secs:6.3f} s '
+            f'implement_reform={reform_secs:6.3f} s\n'
+        )
+    sys.stdout.write(
+        f'{"TOTAL":40s} {"":11s} Policy()={total_init:6.3f} s '
+        f'implement_reform={total_reform:6.3f} s\n'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
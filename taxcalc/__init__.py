@@ -1,6 +1,12 @@
 """
 Specify what is available to import from the taxcalc package.
 """
+# NOTE: the version is specified before the imports below because the
+#       decorators module uses it to version the on-disk JIT cache
+__version__ = '6.8.1'
+__min_python3_version__ = 12
+__max_python3_version__ = 14
+
 from taxcalc.behresp import *
 from taxcalc.calculator import *
 from taxcalc.consumption import *
@@ -14,7 +20,3 @@ from taxcalc.records import *
 from taxcalc.taxcalcio import *
 from taxcalc.utils import *
 from taxcalc.cli import *
-
-__version__ = '6.8.1'
-__min_python3_version__ = 12
-__max_python3_version__ = 14
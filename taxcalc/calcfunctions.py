@@ -20,6 +20,26 @@ import numpy as np
 from taxcalc.decorators import iterate_jit, JIT
 
 
+# benefit programs aggregated by BenefitPrograms, in a fixed order:
+#   (record_array_name, repeal_param_or_None, value_param_or_None)
+# repeal_param=None ==> program has no repeal flag (UBI only).
+# value_param=None  ==> cash benefit, valued at full dollar cost.
+BENEFIT_PROGRAMS = (
+    ('housing_ben', 'BEN_housing_repeal', 'BEN_housing_value'),
+    ('ssi_ben', 'BEN_ssi_repeal', None),
+    ('snap_ben', 'BEN_snap_repeal', 'BEN_snap_value'),
+    ('tanf_ben', 'BEN_tanf_repeal', 'BEN_tanf_value'),
+    ('vet_ben', 'BEN_vet_repeal', 'BEN_vet_value'),
+    ('wic_ben', 'BEN_wic_repeal', 'BEN_wic_value'),
+    ('mcare_ben', 'BEN_mcare_repeal', 'BEN_mcare_value'),
+    ('mcaid_ben', 'BEN_mcaid_repeal', 'BEN_mcaid_value'),
+    ('e02400', 'BEN_oasdi_repeal', None),  # OASDI Social Security
+    ('e02300', 'BEN_ui_repeal', None),  # Unemployment Insurance
+    ('ubi', None, None),  # UBI reform construct
+    ('other_ben', 'BEN_other_repeal', 'BEN_other_value'),
+)
+
+
 def BenefitPrograms(calc):
     """
     Aggregate per-record government cost and consumption value of the
@@ -46,38 +66,20 @@ def BenefitPrograms(calc):
     None:
         The function modifies calc
     """
-    # programs aggregated below, in a fixed order:
-    #   (record_array_name, repeal_param_or_None, value_param_or_None)
-    # repeal_param=None ==> program has no repeal flag (UBI only).
-    # value_param=None  ==> cash benefit, valued at full dollar cost.
-    programs = (
-        ('housing_ben', 'BEN_housing_repeal', 'BEN_housing_value'),
-        ('ssi_ben', 'BEN_ssi_repeal', None),
-        ('snap_ben', 'BEN_snap_repeal', 'BEN_snap_value'),
-        ('tanf_ben', 'BEN_tanf_repeal', 'BEN_tanf_value'),
-        ('vet_ben', 'BEN_vet_repeal', 'BEN_vet_value'),
-        ('wic_ben', 'BEN_wic_repeal', 'BEN_wic_value'),
-        ('mcare_ben', 'BEN_mcare_repeal', 'BEN_mcare_value'),
-        ('mcaid_ben', 'BEN_mcaid_repeal', 'BEN_mcaid_value'),
-        ('e02400', 'BEN_oasdi_repeal', None),  # OASDI Social Security
-        ('e02300', 'BEN_ui_repeal', None),  # Unemployment Insurance
-        ('ubi', None, None),  # UBI reform construct
-        ('other_ben', 'BEN_other_repeal', 'BEN_other_value'),
-    )
     # zero out benefits delivered by repealed programs
-    zero = np.zeros(calc.array_len)
-    for name, repeal_param, _ in programs:
+    zero = np.zeros_like(calc.array('benefit_cost_total'))
+    for name, repeal_param, _ in BENEFIT_PROGRAMS:
         if repeal_param is not None and calc.policy_param(repeal_param):
             calc.array(name, zero)
     # calculate government cost of all benefits
-    cost = sum(calc.array(name) for name, _, _ in programs)
+    cost = sum(calc.array(name) for name, _, _ in BENEFIT_PROGRAMS)
     calc.array('benefit_cost_total', cost)
     # calculate consumption value of all benefits
     # (cash benefits are valued at full dollar cost)
     value = sum(
         calc.array(name) if vparam is None
         else calc.array(name) * calc.consump_param(vparam)
-        for name, _, vparam in programs
+        for name, _, vparam in BENEFIT_PROGRAMS
     )
     calc.array('benefit_value_total', value)
 
@@ -24,7 +24,10 @@ from taxcalc.calcfunctions import (TaxInc, SchXYZTax, GainsTax, AGIsurtax,
                                    CharityCredit,
                                    NonrefundableCredits, C1040, IITAX,
                                    FairShareTax, LumpSumTax, BenefitPrograms,
-                                   ExpandIncome, AfterTaxIncome)
+                                   ExpandIncome, AfterTaxIncome,
+                                   BENEFIT_PROGRAMS)
+from taxcalc.decorators import using_threads
+from taxcalc.fusedcalc import fused_calc_all
 from taxcalc.policy import Policy
 from taxcalc.records import Records
 from taxcalc.consumption import Consumption
@@ -68,6 +71,21 @@ class Calculator():
         consumption values specified implying consumption value is equal to
         government cost of providing the in-kind benefits
 
+    fused: boolean
+        specifies whether or not the calc_all method does all the tax
+        calculations for each filing unit in one fused loop over the
+        records, which reduces memory traffic on large input files and
+        produces results identical to the default unfused calculations;
+        default value is false.
+
+    num_threads: integer or None
+        specifies the number of threads used by the calc_all method to
+        do the tax calculations on contiguous chunks of the records in
+        parallel, which produces results identical to those produced
+        using one thread; default value of None implies the number of
+        threads specified by the TAXCALCNUMTHREADS environment variable
+        (or one thread when that environment variable is not set).
+
     Raises
     ------
     ValueError:
@@ -90,11 +108,16 @@ class Calculator():
 
     All calculations are done on the internal copies of the Policy and
     Records objects passed to each of the two Calculator constructors.
+    The internal Records copies share the read-only input variable arrays
+    of the Records object (see Records.shared_copy), so an input variable
+    array must be changed by using the array() or incarray() methods and
+    not in place.
     """
     # pylint: disable=too-many-public-methods
 
     def __init__(self, policy=None, records=None, verbose=False,
-                 sync_years=True, consumption=None):
+                 sync_years=True, consumption=None, fused=False,
+                 num_threads=None):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         # pylint: disable=too-many-branches
         if isinstance(policy, Policy):
@@ -102,7 +125,7 @@ class Calculator():
         else:
             raise ValueError('must specify policy as a Policy object')
         if isinstance(records, Records):
-            self.__records = copy.deepcopy(records)
+            self.__records = records.shared_copy()
         else:
             raise ValueError('must specify records as a Records object')
         if self.__policy.current_year < self.__records.data_year:
@@ -139,6 +162,10 @@ class Calculator():
         assert self.__policy.current_year == self.__records.current_year
         assert self.__policy.current_year == self.__consumption.current_year
         self.__stored_records = None
+        self.__fused = fused
+        if num_threads is not None and num_threads < 1:
+            raise ValueError('num_threads must be None or at least one')
+        self.__num_threads = num_threads
 
     def increment_year(self):
         """
@@ -168,13 +195,20 @@ class Calculator():
         Call all tax-calculation functions for the current_year.
         """
         # conducts static analysis of Calculator object for current_year
-        UBI(self.__policy, self.__records)
-        BenefitPrograms(self)
-        self._calc_one_year(zero_out_calc_vars)
-        FairShareTax(self.__policy, self.__records)
-        LumpSumTax(self.__policy, self.__records)
-        ExpandIncome(self.__policy, self.__records)
-        AfterTaxIncome(self.__policy, self.__records)
+        with using_threads(self.__num_threads):
+            if self.__fused:
+                if zero_out_calc_vars:
+                    self.__records.zero_out_changing_calculated_vars()
+                fused_calc_all(self.__policy, self.__records,
+                               self.__consumption)
+                return
+            UBI(self.__policy, self.__records)
+            BenefitPrograms(self)
+            self._calc_one_year(zero_out_calc_vars)
+            FairShareTax(self.__policy, self.__records)
+            LumpSumTax(self.__policy, self.__records)
+            ExpandIncome(self.__policy, self.__records)
+            AfterTaxIncome(self.__policy, self.__records)
 
     def weighted_total(self, variable_name):
         """
@@ -198,6 +232,8 @@ class Calculator():
         rates) are included in the returned Pandas DataFrame.
         """
         if all_vars:
+            if self.__records.columnar:
+                return self.__records.columnar_dataframe()
             varlist = list(self.__records.USABLE_READ_VARS |
                            self.__records.CALCULATED_VARS)
         else:
@@ -220,6 +256,11 @@ class Calculator():
         if variable_value is None:
             return getattr(self.__records, variable_name)
         assert isinstance(variable_value, np.ndarray)
+        if (self.__stored_records is not None and
+                variable_name not in self.__stored_records):
+            # remember the replaced array so restore_records can reinstate it
+            self.__stored_records[variable_name] = getattr(self.__records,
+                                                           variable_name)
         setattr(self.__records, variable_name, variable_value)
         return None
 
@@ -238,33 +279,50 @@ class Calculator():
         Add variable_add to named variable in embedded Records object.
         """
         assert isinstance(variable_add, np.ndarray)
-        setattr(self.__records, variable_name,
-                self.array(variable_name) + variable_add)
+        self.array(variable_name, self.array(variable_name) + variable_add)
 
     def zeroarray(self, variable_name):
         """
         Set named variable in embedded Records object to zeros.
         """
-        setattr(self.__records, variable_name, np.zeros(self.array_len))
+        self.array(variable_name, np.zeros_like(self.array(variable_name)))
 
     def store_records(self):
         """
-        Make internal copy of embedded Records object that can then be
+        Take a snapshot of the embedded Records object that can then be
         restored after interim calculations that make temporary changes
         to the embedded Records object.
+
+        Only the arrays that interim calculations can change are saved:
+        copies of the arrays that calc_all() and Consumption.response()
+        change in place are made now, and each other array is remembered
+        (without being copied) when it is first replaced by a call to the
+        array() or incarray() methods.  So, between the store_records()
+        and restore_records() calls, an input variable array must not be
+        changed in place, but only by using the array() or incarray()
+        methods.
         """
         assert self.__stored_records is None
-        self.__stored_records = copy.deepcopy(self.__records)
+        inplace_vars = (self.__records.CALCULATED_VARS |
+                        set(Consumption.RESPONSE_VARS) |
+                        set(name for name, _, _ in BENEFIT_PROGRAMS))
+        self.__stored_records = {
+            var: getattr(self.__records, var).copy()
+            for var in inplace_vars
+        }
 
     def restore_records(self):
         """
-        Set the embedded Records object to the stored Records object
-        that was saved in the last call to the store_records() method.
+        Restore in the embedded Records object the arrays that were saved
+        in the last call to the store_records() method.
         """
-        assert isinstance(self.__stored_records, Records)
-        self.__records = copy.deepcopy(self.__stored_records)
-        del self.__stored_records
+        assert isinstance(self.__stored_records, dict)
+        stored_records = self.__stored_records
         self.__stored_records = None
+        for var, value in stored_records.items():
+            setattr(self.__records, var, value)
+        del stored_records
+        self.__records.pack_columns()
 
     @property
     def array_len(self):
@@ -542,6 +600,59 @@ class Calculator():
         del calc_var_dframe
         return diff
 
+    def float32_accuracy_report(self, groupby='weighted_deciles'):
+        """
+        Compare the results of double-precision (float64) and of
+        single-precision (float32) calculations of the policy, records, and
+        consumption embedded in self for the current_year; this method
+        leaves the Calculator object unchanged.
+
+        Parameters
+        ----------
+        groupby : String object
+            specifies the distribution table rows as in the
+            distribution_tables method
+
+        Returns
+        -------
+        tuple containing two Pandas DataFrame objects:
+        aggregates : weighted sums of iitax, payrolltax, and combined taxes
+            (in billions of dollars) with float64 and float32 columns and
+            with columns containing their absolute and relative differences
+        table_diff : distribution table cells of the float32 calculations
+            minus the corresponding cells of the float64 calculations
+        """
+        calcs = {}
+        for name in ['float64', 'float32']:
+            records = self.__records
+            if records.float_dtype != np.dtype(name):
+                records = records.float_dtype_copy(np.dtype(name).type)
+            calc = Calculator(policy=self.__policy, records=records,
+                              consumption=self.__consumption,
+                              fused=self.__fused,
+                              num_threads=self.__num_threads)
+            calc.calc_all()
+            calcs[name] = calc
+        aggregates = pd.DataFrame(
+            {
+                name: [calc.weighted_total(var) * 1e-9
+                       for var in ['iitax', 'payrolltax', 'combined']]
+                for name, calc in calcs.items()
+            },
+            index=['iitax', 'payrolltax', 'combined']
+        )
+        aggregates['abs_diff'] = aggregates['float32'] - aggregates['float64']
+        aggregates['rel_diff'] = np.divide(
+            aggregates['abs_diff'], aggregates['float64'].abs(),
+            out=np.zeros(len(aggregates.index)),
+            where=aggregates['float64'] != 0
+        )
+        dt64, dt32 = calcs['float64'].distribution_tables(calcs['float32'],
+                                                          groupby)
+        table_diff = dt32 - dt64
+        del calcs
+        return (aggregates, table_diff)
+
     MTR_VALID_VARIABLES = ['e00200p', 'e00200s',
                            'e00900p', 'e00300',
                            'e00400', 'e00600',
@@ -640,7 +751,6 @@ class Calculator():
         'k1bx14p', Partnership income (also included in e26270 and e02000).
         """
         # pylint: disable=too-many-arguments,too-many-positional-arguments
-        # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         assert not zero_out_calculated_vars or not calc_all_already_called
         # check validity of variable_str parameter
         if variable_str not in Calculator.MTR_VALID_VARIABLES:
@@ -650,53 +760,134 @@ class Calculator():
         assert abs(finite_diff) > 0, 'mtr finite_diff must be non-zero'
         # remember records object in order to restore it after mtr computations
         self.store_records()
+        # calculate level of taxes after a marginal increase in income
+        variable = self._mtr_perturb(variable_str, finite_diff)
+        self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
+        taxes_chng = (self.array('payrolltax'), self.array('iitax'))
+        # calculate base level of taxes after restoring records object
+        self.restore_records()
+        if not calc_all_already_called or zero_out_calculated_vars:
+            self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
+        taxes_base = (self.array('payrolltax'), self.array('iitax'))
+        # compute and return the three marginal tax rate arrays
+        return self._mtr_rates(variable_str, variable, finite_diff,
+                               taxes_chng, taxes_base, wrt_full_compensation)
+
+    def mtr_many(self, variables=None,
+                 finite_diff=0.01,  # can be positive or negative, but not zero
+                 zero_out_calculated_vars=False,
+                 calc_all_already_called=False,
+                 wrt_full_compensation=True):
+        """
+        Calculates the marginal payroll, individual income, and combined
+        tax rates for every tax filing unit with respect to each of several
+        variables, leaving the Calculator object in exactly the same state
+        as it would be in after a calc_all() call.
+
+        The marginal tax rates for each variable are the same as those
+        returned by the mtr() method, but the base level of taxes is
+        calculated only once for all the variables, which makes this method
+        faster than a sequence of mtr() calls.
+
+        Parameters
+        ----------
+        variables: list of strings or None
+            each string specifies type of income or expense that is increased
+            to compute the marginal tax rates.  If None, marginal tax rates
+            are computed for all the MTR_VALID_VARIABLES.  See documentation
+            of the mtr() method for list of valid variables.
+
+        finite_diff: float
+            see documentation of the mtr() method.
+
+        zero_out_calculated_vars: boolean
+            see documentation of the mtr() method.
+
+        calc_all_already_called: boolean
+            see documentation of the mtr() method.
+
+        wrt_full_compensation: boolean
+            see documentation of the mtr() method.
+
+        Returns
+        -------
+        A dictionary whose keys are the variables and whose values are
+        tuples of numpy arrays in the same order as returned by mtr():
+        (mtr_payrolltax, mtr_incometax, mtr_combined).
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        assert not zero_out_calculated_vars or not calc_all_already_called
+        # check validity of variables parameter
+        if variables is None:
+            variables = Calculator.MTR_VALID_VARIABLES
+        for variable_str in variables:
+            if variable_str not in Calculator.MTR_VALID_VARIABLES:
+                msg = 'mtr_many variable "{}" is not valid'
+                raise ValueError(msg.format(variable_str))
+        # check value of finite_diff parameter
+        assert abs(finite_diff) > 0, 'mtr finite_diff must be non-zero'
+        # calculate base level of taxes just once
+        if not calc_all_already_called or zero_out_calculated_vars:
+            self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
+        taxes_base = (self.array('payrolltax').copy(),
+                      self.array('iitax').copy())
+        # calculate level of taxes after a marginal increase in each variable
+        # restoring the base records object after each calculation
+        mtrs = {}
+        for variable_str in variables:
+            self.store_records()
+            variable = self._mtr_perturb(variable_str, finite_diff)
+            self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
+            taxes_chng = (self.array('payrolltax'), self.array('iitax'))
+            self.restore_records()
+            mtrs[variable_str] = self._mtr_rates(
+                variable_str, variable, finite_diff,
+                taxes_chng, taxes_base, wrt_full_compensation
+            )
+        return mtrs
+
+    def _mtr_perturb(self, variable_str, finite_diff):
+        """
+        Add finite_diff to the specified variable (and to any variable that
+        includes it) in the embedded Records object, apply any consumption
+        response, and return the unperturbed variable array.
+        """
         # extract variable array(s) from embedded records object
         variable = self.array(variable_str)
-        if variable_str == 'e00200p':
-            earnings_var = self.array('e00200')
-        elif variable_str == 'e00200s':
-            earnings_var = self.array('e00200')
+        if variable_str in ('e00200p', 'e00200s'):
+            included_in = ['e00200']
         elif variable_str == 'e00900p':
-            seincome_var = self.array('e00900')
+            included_in = ['e00900']
         elif variable_str == 'e00650':
-            divincome_var = self.array('e00600')
+            included_in = ['e00600']
         elif variable_str == 'e26270':
-            scheincome_var = self.array('e02000')
+            included_in = ['e02000']
         elif variable_str == 'k1bx14p':
-            scheincome_var = self.array('e02000')
-            scorpincome_var = self.array('e26270')
-        # calculate level of taxes after a marginal increase in income
+            included_in = ['e02000', 'e26270']
+        else:
+            included_in = []
+        # increase variable array(s) by finite_diff
         self.array(variable_str, variable + finite_diff)
-        if variable_str == 'e00200p':
-            self.array('e00200', earnings_var + finite_diff)
-        elif variable_str == 'e00200s':
-            self.array('e00200', earnings_var + finite_diff)
-        elif variable_str == 'e00900p':
-            self.array('e00900', seincome_var + finite_diff)
-        elif variable_str == 'e00650':
-            self.array('e00600', divincome_var + finite_diff)
-        elif variable_str == 'e26270':
-            self.array('e02000', scheincome_var + finite_diff)
-        elif variable_str == 'k1bx14p':
-            self.array('e02000', scheincome_var + finite_diff)
-            self.array('e26270', scorpincome_var + finite_diff)
+        for var in included_in:
+            self.array(var, self.array(var) + finite_diff)
         if self.__consumption.has_response():
             self.__consumption.response(self.__records, finite_diff)
-        self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
-        payrolltax_chng = self.array('payrolltax')
-        incometax_chng = self.array('iitax')
-        combined_taxes_chng = incometax_chng + payrolltax_chng
-        # calculate base level of taxes after restoring records object
-        self.restore_records()
-        if not calc_all_already_called or zero_out_calculated_vars:
-            self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
-        payrolltax_base = self.array('payrolltax')
-        incometax_base = self.array('iitax')
-        combined_taxes_base = incometax_base + payrolltax_base
+        return variable
+
+    def _mtr_rates(self, variable_str, variable, finite_diff,
+                   taxes_chng, taxes_base, wrt_full_compensation):
+        """
+        Return tuple of marginal payroll, income, and combined tax rate
+        arrays given the (payrolltax, iitax) tuples of arrays calculated
+        after (taxes_chng) and before (taxes_base) the increase in variable.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-locals
         # compute marginal changes in combined tax liability
-        payrolltax_diff = payrolltax_chng - payrolltax_base
-        incometax_diff = incometax_chng - incometax_base
-        combined_diff = combined_taxes_chng - combined_taxes_base
+        payrolltax_diff = taxes_chng[0] - taxes_base[0]
+        incometax_diff = taxes_chng[1] - taxes_base[1]
+        combined_diff = ((taxes_chng[1] + taxes_chng[0]) -
+                         (taxes_base[1] + taxes_base[0]))
         # specify optional adjustment for employer (er) OASDI+HI payroll taxes
         mtr_on_earnings = variable_str in ('e00200p', 'e00200s')
         if wrt_full_compensation and mtr_on_earnings:
@@ -723,30 +914,6 @@ class Calculator():
             mtr_payrolltax = np.where(mars == 2, mtr_payrolltax, np.nan)
             mtr_incometax = np.where(mars == 2, mtr_incometax, np.nan)
             mtr_combined = np.where(mars == 2, mtr_combined, np.nan)
-        # delete intermediate variables
-        del variable
-        if variable_str in ('e00200p', 'e00200s'):
-            del earnings_var
-        elif variable_str == 'e00900p':
-            del seincome_var
-        elif variable_str == 'e00650':
-            del divincome_var
-        elif variable_str == 'e26270':
-            del scheincome_var
-        elif variable_str == 'k1bx14p':
-            del scheincome_var
-            del scorpincome_var
-        del payrolltax_chng
-        del incometax_chng
-        del combined_taxes_chng
-        del payrolltax_base
-        del incometax_base
-        del combined_taxes_base
-        del payrolltax_diff
-        del incometax_diff
-        del combined_diff
-        del adj
-        # return the three marginal tax rate arrays
         return (mtr_payrolltax, mtr_incometax, mtr_combined)
 
     def mtr_graph(self, calc,
@@ -6,12 +6,14 @@ which can be accessed as 'tc' from an installed taxcalc package.
 # pycodestyle tc.py
 # pylint --disable=locally-disabled tc.py
 
+import io
 import os
 import sys
 import time
 import sqlite3
 import argparse
 import difflib
+import pandas as pd
 import taxcalc as tc
 
 
@@ -46,7 +48,8 @@ def cli_tc_main():
         ),
         (
             '          '
-            '[--runid N] [--silent] [--test] [--version] [--usage]'
+            '[--runid N] [--silent] [--test] [--warmup] [--version] '
+            '[--usage]'
         )
     )
     parser = argparse.ArgumentParser(
@@ -168,6 +171,13 @@ def cli_tc_main():
                               'and quits leaving the test-related files.'),
                         default=False,
                         action='store_true')
+    parser.add_argument('--warmup',
+                        help=('optional flag that compiles all the tax '
+                              'calculation functions into the on-disk JIT '
+                              'cache specified by the TAXCALCJITCACHE '
+                              'environment variable and quits.'),
+                        default=False,
+                        action='store_true')
     parser.add_argument('--version',
                         help=('optional flag that writes Tax-Calculator '
                               'release version to stdout and quits.'),
@@ -206,6 +216,9 @@ def cli_tc_main():
     if args.usage:
         sys.stdout.write(f'USAGE: {usage_str}\n')
         return 0
+    # fill on-disk JIT cache and quit if --warmup option is specified
+    if args.warmup:
+        return _warmup_jit_cache()
     # write test input and expected output files if --test option is specified
     if args.test:
         _write_test_files()
@@ -457,6 +470,29 @@ def _write_test_files():
         tfile.write(TEST_TABULATE_SQLCODE)
 
 
+def _warmup_jit_cache():
+    """
+    Private function that compiles all tax calculation functions into
+    the on-disk JIT cache by doing calculations on the tc --test input.
+    """
+    if not tc.decorators.JIT_CACHE_DIR:
+        sys.stderr.write(
+            'ERROR: --warmup requires the TAXCALCJITCACHE environment '
+            'variable to specify a JIT cache directory\n'
+        )
+        return 1
+    start_time = time.time()
+    rec = tc.Records(data=pd.read_csv(io.StringIO(TEST_INPUT_DATA)),
+                     start_year=TEST_TAXYEAR, gfactors=None, weights=None)
+    calc = tc.Calculator(policy=tc.Policy(), records=rec)
+    calc.calc_all()
+    sys.stdout.write(
+        f'Wrote compiled functions to {tc.decorators.JIT_CACHE_DIR} '
+        f'in {(time.time() - start_time):.1f} seconds\n'
+    )
+    return 0
+
+
 def _compare_test_output_files():
     """
     Private function that compares expected and actual tc --test results;
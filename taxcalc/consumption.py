@@ -85,7 +85,7 @@ class Consumption(Parameters):
         for var in Consumption.RESPONSE_VARS:
             records_var = getattr(records, var)
             mpc_var = getattr(self, f'MPC_{var}')
-            records_var[:] += mpc_var * income_change
+            setattr(records, var, records_var + mpc_var * income_change)
 
     def benval_params(self):
         """
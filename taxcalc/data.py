@@ -7,12 +7,75 @@ Tax-Calculator abstract base data class.
 
 import os
 import abc
+import copy
+import json
+import weakref
+import itertools
 import numpy as np
 import pandas as pd
 from taxcalc.growfactors import GrowFactors
 from taxcalc.utils import read_egg_csv, read_egg_json, json_to_dict
 
 
+class _InputArrays():
+    """
+    Immutable set of read-only input variable arrays that can be shared
+    by several Data objects.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, root, arrays, gfactors, columns):
+        self.root = root
+        self.arrays = arrays
+        self.gfactors = gfactors
+        self.columns = columns
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class _SharedInputs():
+    """
+    Registry of the _InputArrays objects shared by a family of Data objects
+    created by the Data.shared_copy method.  Each _InputArrays object is
+    registered under the serial number of its root _InputArrays object and
+    the name and year argument of the last method that changed the arrays,
+    and it is removed from the registry when no Data object uses it.
+    """
+
+    def __init__(self):
+        self.__serials = itertools.count()
+        self.__children = weakref.WeakValueDictionary()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_SharedInputs, ())
+
+    def root(self, arrays, gfactors, columns):
+        """
+        Return new _InputArrays object that has no parent.
+        """
+        return _InputArrays(next(self.__serials), arrays, gfactors, columns)
+
+    def child(self, parent, change_name, year):
+        """
+        Return registered child of parent or None if not registered.
+        """
+        return self.__children.get((parent.root, change_name, year))
+
+    def add_child(self, parent, change_name, year, arrays, gfactors,
+                  columns):
+        """
+        Register and return new child of parent.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        child = _InputArrays(parent.root, arrays, gfactors, columns)
+        self.__children[(parent.root, change_name, year)] = child
+        return child
+
+
 class Data():
     """
     Inherit from this class for Records and other collections of
@@ -49,6 +112,21 @@ class Data():
         while TMD input data generated in the tax-microdata repository
         use a 1.0 weights_scale value.
 
+    columnar: boolean
+        specifies whether or not the variable arrays are stored as the rows
+        of a few contiguous two-dimensional blocks (one for the float input
+        variables, one for the integer input variables, and likewise for the
+        calculated variables), in which case each variable attribute is a
+        view of a block row.  Default value is False, which implies each
+        variable array is allocated separately.
+
+    float32: boolean
+        specifies whether or not the float variable arrays are stored in
+        single precision (numpy.float32), which halves their memory use
+        at the cost of some accuracy (see Calculator.float32_accuracy_report).
+        Default value is False, which implies double precision (float64).
+        The sample weights are always double precision.
+
     Raises
     ------
     ValueError:
@@ -70,8 +148,17 @@ class Data():
     VARINFO_FILE_NAME = None
     VARINFO_FILE_PATH = None
 
+    # version of the binary data directory format (see write_binary method)
+    BINARY_FORMAT_VERSION = 1
+    BINARY_MANIFEST_NAME = 'manifest.json'
+
+    # names of the columnar blocks of input and calculated variables
+    INPUT_GROUPS = ['input_float', 'input_int']
+    CALC_GROUPS = ['calc_float', 'calc_int']
+
     def __init__(self, data, start_year, gfactors=None,
-                 weights=None, weights_scale=0.01):
+                 weights=None, weights_scale=0.01, columnar=False,
+                 float32=False):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
 
         # initialize data variable info sets and read variable information
@@ -82,6 +169,10 @@ class Data():
         self.CHANGING_CALCULATED_VARS = set()
         self.INTEGER_VARS = set()
         self._read_var_info()
+        self._shared_inputs = None
+        self._input_arrays = None
+        self._columns = {} if columnar else None
+        self._float_dtype = np.float32 if float32 else np.float64
         if data is not None:
             # check consistency of specified gfactors and weights
             if gfactors is None and weights is None:
@@ -138,6 +229,20 @@ class Data():
         """
         return self.__current_year
 
+    @property
+    def columnar(self):
+        """
+        Data class columnar storage property.
+        """
+        return self._columns is not None
+
+    @property
+    def float_dtype(self):
+        """
+        Data class numpy dtype of float variable arrays property.
+        """
+        return self._float_dtype
+
     @property
     def array_length(self):
         """
@@ -154,7 +259,7 @@ class Data():
         self.__current_year += 1
         if self.__aging_data:
             # ... apply variable extrapolation growth factors
-            self._extrapolate(self.__current_year)
+            self._change_inputs(self._extrapolate, self.__current_year)
             # ... specify current-year sample weights
             wt_colname = f'WT{self.__current_year}'
             assert wt_colname in self.WT.columns, (
@@ -162,8 +267,270 @@ class Data():
             )
             self.s006 = self.WT[wt_colname] * self.weights_scale
 
+    def shared_copy(self):
+        """
+        Return a copy of self that shares with self the input variable
+        arrays (and the sample weights and growth factors), but that has its
+        own copies of the calculated variable arrays.
+
+        After this call the input variable arrays of self and of the copy
+        are read-only, so they must be changed only by replacing them.
+        When self and the copy are incremented to the same year, they also
+        share the extrapolated input variable arrays for that year.
+        """
+        if self._shared_inputs is None:
+            self._shared_inputs = _SharedInputs()
+        if not self._using_input_arrays():
+            self._input_arrays = self._shared_inputs.root(
+                self._freeze_input_arrays(), self.gfactors,
+                self._input_columns()
+            )
+        # pylint: disable=protected-access
+        dup = copy.copy(self)
+        if self.columnar:
+            dup._columns = dict(self._columns)
+            dup._pack_columns(Data.CALC_GROUPS)
+        else:
+            for varname in self.CALCULATED_VARS:
+                setattr(dup, varname, getattr(self, varname).copy())
+        return dup
+
+    def float_dtype_copy(self, float_dtype):
+        """
+        Return a deep copy of self in which all the float variable arrays
+        have the specified numpy float_dtype (numpy.float32 or numpy.float64).
+        """
+        # pylint: disable=protected-access
+        assert float_dtype in (np.float32, np.float64)
+        dup = copy.deepcopy(self)
+        dup._float_dtype = float_dtype
+        dup._shared_inputs = None
+        dup._input_arrays = None
+        for varname in dup.USABLE_READ_VARS | dup.CALCULATED_VARS:
+            arr = getattr(dup, varname)
+            if isinstance(arr, np.ndarray) and arr.dtype.kind == 'f':
+                setattr(dup, varname, arr.astype(float_dtype))
+        if dup.columnar:
+            dup._pack_columns(list(dup._columns))
+        return dup
+
+    def pack_columns(self):
+        """
+        Copy into new contiguous blocks the variables of each columnar block
+        that has had some of its variable arrays replaced, so that all the
+        variable attributes are again views of block rows.  Does nothing when
+        self is not columnar.
+        """
+        if not self.columnar:
+            return
+        groups = [group for group in self._columns
+                  if not self._group_is_packed(group)]
+        if groups:
+            self._pack_columns(groups)
+
+    def columnar_dataframe(self):
+        """
+        Return Pandas DataFrame containing all the input and calculated
+        variables, which is built from the columnar blocks when self is
+        columnar and from the individual variable arrays otherwise.
+        """
+        rows = []
+        columns = []
+        for group in (self._columns or {}):
+            names = self._columns[group]['names']
+            if self._group_is_packed(group):
+                rows.append(self._columns[group]['block'])
+            else:
+                rows.append(np.stack([getattr(self, name) for name in names]))
+            columns.extend(names)
+        others = sorted((self.USABLE_READ_VARS | self.CALCULATED_VARS) -
+                        set(columns))
+        if others:
+            rows.append(np.stack([np.asarray(getattr(self, name))
+                                  for name in others]))
+            columns.extend(others)
+        data = np.concatenate(rows, dtype=np.float64, casting='unsafe')
+        return pd.DataFrame(data=data.T, columns=columns, copy=False)
+
+    @classmethod
+    def write_binary(cls, dirpath, data, start_year,
+                     weights=None, weights_scale=0.01):
+        """
+        Write data (and optional weights), which are specified as in the
+        class constructor, to a new binary directory that contains a JSON
+        manifest and one two-dimensional numpy .npy file for each of the
+        float input variables, the integer input variables, and the weights.
+        Passing the directory path as the data (and weights) argument of the
+        class constructor memory-maps the binary files, which is much faster
+        than reading a CSV file.  Input variables not used by Tax-Calculator
+        are not written.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-locals
+        if not isinstance(start_year, int):
+            raise ValueError('start_year is not an integer')
+        if isinstance(data, str):
+            data = pd.read_csv(data)
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError('data is neither a string nor a Pandas DataFrame')
+        if isinstance(weights, str):
+            weights = pd.read_csv(weights)
+        if weights is not None and not isinstance(weights, pd.DataFrame):
+            raise ValueError('weights is not None or a string or a DataFrame')
+        varinfo = cls(data=None, start_year=None)
+        os.makedirs(dirpath)
+        int_vars = [name for name in data.columns
+                    if name in varinfo.INTEGER_READ_VARS]
+        float_vars = [name for name in data.columns
+                      if name in varinfo.USABLE_READ_VARS and
+                      name not in varinfo.INTEGER_READ_VARS]
+        for kind, varnames, dtype in [('float', float_vars, np.float64),
+                                      ('int', int_vars, np.int32)]:
+            if varnames:
+                block = np.empty((len(varnames), len(data.index)), dtype)
+                for row, varname in zip(block, varnames):
+                    row[:] = data[varname].to_numpy(dtype=dtype)
+                np.save(os.path.join(dirpath, f'{kind}_vars.npy'), block)
+                del block
+        if weights is not None:
+            np.save(os.path.join(dirpath, 'weights.npy'),
+                    weights.to_numpy(dtype=np.float64))
+        manifest = {
+            'format_version': Data.BINARY_FORMAT_VERSION,
+            'start_year': start_year,
+            'weights_scale': weights_scale,
+            'array_length': len(data.index),
+            'float_vars': float_vars,
+            'int_vars': int_vars,
+            'weights_columns': (None if weights is None
+                                else [str(col) for col in weights.columns])
+        }
+        with open(os.path.join(dirpath, Data.BINARY_MANIFEST_NAME), 'w',
+                  encoding='utf-8') as mfile:
+            json.dump(manifest, mfile, indent=1)
+
+    @staticmethod
+    def read_binary_manifest(dirpath):
+        """
+        Return dictionary containing the manifest of the binary directory
+        written by the write_binary method.
+        """
+        path = os.path.join(dirpath, Data.BINARY_MANIFEST_NAME)
+        if not os.path.isfile(path):
+            raise ValueError(f'{dirpath} is not a binary data directory')
+        with open(path, 'r', encoding='utf-8') as mfile:
+            manifest = json.load(mfile)
+        if manifest.get('format_version') != Data.BINARY_FORMAT_VERSION:
+            raise ValueError(f'{dirpath} has unsupported binary format')
+        return manifest
+
     # ----- begin private methods of Data class -----
 
+    def _using_input_arrays(self):
+        """
+        Return True if self uses all the arrays in self._input_arrays.
+        """
+        if self._input_arrays is None:
+            return False
+        if self.gfactors is not self._input_arrays.gfactors:
+            return False
+        for varname, arr in self._input_arrays.arrays.items():
+            if getattr(self, varname) is not arr:
+                return False
+        return True
+
+    def _change_inputs(self, change, year):
+        """
+        Call change(year) to change input variable arrays in place, but
+        if the input variable arrays are shared by a family of Data objects
+        created by the shared_copy method, reuse the result of the same
+        change made by another member of the family when possible.
+        """
+        if self._shared_inputs is None:
+            change(year)
+            return
+        using_input_arrays = self._using_input_arrays()
+        if using_input_arrays:
+            child = self._shared_inputs.child(self._input_arrays,
+                                              change.__name__, year)
+            if child is not None:
+                for varname, arr in child.arrays.items():
+                    setattr(self, varname, arr)
+                if child.columns is not None:
+                    self._columns.update(child.columns)
+                self._input_arrays = child
+                return
+        # make private copies of read-only arrays and change them in place
+        if self.columnar:
+            self._pack_columns(Data.INPUT_GROUPS)
+        else:
+            for varname in self.USABLE_READ_VARS:
+                arr = getattr(self, varname)
+                if isinstance(arr, np.ndarray) and not arr.flags.writeable:
+                    setattr(self, varname, arr.copy())
+        change(year)
+        if not using_input_arrays:
+            self._input_arrays = None
+            return
+        # share the changed arrays with the rest of the family
+        self._input_arrays = self._shared_inputs.add_child(
+            self._input_arrays, change.__name__, year,
+            self._freeze_input_arrays(), self.gfactors, self._input_columns()
+        )
+
+    def _input_columns(self):
+        """
+        Return dictionary of the columnar input blocks or None if self is
+        not columnar.
+        """
+        if not self.columnar:
+            return None
+        return {group: self._columns[group] for group in Data.INPUT_GROUPS
+                if group in self._columns}
+
+    def _group_is_packed(self, group):
+        """
+        Return True if every variable in the columnar block group is a view
+        of its block row.
+        """
+        info = self._columns[group]
+        for name, view in zip(info['names'], info['views']):
+            if getattr(self, name) is not view:
+                return False
+        return True
+
+    def _pack_columns(self, groups):
+        """
+        Copy the variables in each of the specified columnar block groups
+        into a new contiguous block and set the variable attributes to views
+        of the block rows.
+        """
+        for group in groups:
+            if group not in self._columns:
+                continue
+            names = self._columns[group]['names']
+            dtype = np.int32 if group.endswith('_int') else self._float_dtype
+            block = np.empty((len(names), self.array_length), dtype=dtype)
+            views = list(block)
+            for name, view in zip(names, views):
+                view[:] = getattr(self, name)
+                setattr(self, name, view)
+            self._columns[group] = {'names': names, 'block': block,
+                                    'views': views}
+
+    def _freeze_input_arrays(self):
+        """
+        Make input variable arrays read-only and return them in a dictionary.
+        Note that s006 is not included because it is not a numpy array.
+        """
+        arrays = {}
+        for varname in self.USABLE_READ_VARS:
+            arr = getattr(self, varname)
+            if isinstance(arr, np.ndarray):
+                arr.flags.writeable = False
+                arrays[varname] = arr
+        return arrays
+
     def _read_var_info(self):
         """
         Read Data variables metadata from JSON file and
@@ -202,12 +569,62 @@ class Data():
 
     def _read_data(self, data):
         """
-        Read data from file or use specified DataFrame as data.
+        Read data from file or binary directory or use specified DataFrame
+        as data.
         """
         # pylint: disable=too-many-branches
         if data is None:
             return  # because there are no data to read
         # read specified data
+        self.IGNORED_VARS = set()
+        if isinstance(data, str) and os.path.isdir(data):
+            READ_VARS, self.__index = self._read_binary_data(data)
+        else:
+            READ_VARS, self.__index = self._read_dataframe_data(data)
+        self.__dim = len(self.__index)
+        # check that MUST_READ_VARS are all present in data
+        if not self.MUST_READ_VARS.issubset(READ_VARS):
+            raise ValueError('data missing one or more MUST_READ_VARS')
+        # create other class variables that are set to all zeros
+        UNREAD_VARS = self.USABLE_READ_VARS - READ_VARS
+        ZEROED_VARS = self.CALCULATED_VARS | UNREAD_VARS
+        for varname in ZEROED_VARS:
+            if varname in self.INTEGER_VARS:
+                setattr(
+                    self,
+                    varname,
+                    np.zeros(self.array_length, dtype=np.int32)
+                )
+            else:
+                setattr(
+                    self,
+                    varname,
+                    np.zeros(self.array_length, dtype=self._float_dtype)
+                )
+        # delete intermediate variables
+        del READ_VARS
+        del UNREAD_VARS
+        del ZEROED_VARS
+        # optionally store variables in contiguous columnar blocks
+        if self.columnar:
+            for group, varnames in [('input', self.USABLE_READ_VARS),
+                                    ('calc', self.CALCULATED_VARS)]:
+                for kind in ('float', 'int'):
+                    names = sorted(
+                        name for name in varnames - {'s006'}
+                        if ((name in self.INTEGER_VARS) == (kind == 'int'))
+                    )
+                    if names:
+                        self._columns[f'{group}_{kind}'] = {
+                            'names': names, 'block': None, 'views': []
+                        }
+            self._pack_columns(list(self._columns))
+
+    def _read_dataframe_data(self, data):
+        """
+        Read data from CSV file or use specified DataFrame as data,
+        and return set of names of variables read and the data index.
+        """
         if isinstance(data, pd.DataFrame):
             taxdf = data
         elif isinstance(data, str):
@@ -218,11 +635,8 @@ class Data():
         else:
             msg = 'data is neither a string nor a Pandas DataFrame'
             raise ValueError(msg)
-        self.__dim = len(taxdf.index)
-        self.__index = taxdf.index
         # create class variables using taxdf column names
         READ_VARS = set()
-        self.IGNORED_VARS = set()
         for varname in list(taxdf.columns.values):
             if varname in self.USABLE_READ_VARS:
                 READ_VARS.add(varname)
@@ -236,35 +650,40 @@ class Data():
                     setattr(
                         self,
                         varname,
-                        taxdf[varname].to_numpy(dtype=np.float64, copy=True)
+                        taxdf[varname].to_numpy(dtype=self._float_dtype,
+                                                copy=True)
                     )
             else:
                 self.IGNORED_VARS.add(varname)
-        # check that MUST_READ_VARS are all present in taxdf
-        if not self.MUST_READ_VARS.issubset(READ_VARS):
-            raise ValueError('data missing one or more MUST_READ_VARS')
+        index = taxdf.index
         # delete intermediate taxdf object
         del taxdf
-        # create other class variables that are set to all zeros
-        UNREAD_VARS = self.USABLE_READ_VARS - READ_VARS
-        ZEROED_VARS = self.CALCULATED_VARS | UNREAD_VARS
-        for varname in ZEROED_VARS:
-            if varname in self.INTEGER_VARS:
-                setattr(
-                    self,
-                    varname,
-                    np.zeros(self.array_length, dtype=np.int32)
-                )
-            else:
-                setattr(
-                    self,
-                    varname,
-                    np.zeros(self.array_length, dtype=np.float64)
-                )
-        # delete intermediate variables
-        del READ_VARS
-        del UNREAD_VARS
-        del ZEROED_VARS
+        return READ_VARS, index
+
+    def _read_binary_data(self, dirpath):
+        """
+        Memory-map data in binary directory written by the write_binary
+        method, and return set of names of variables read and the data
+        index.  The arrays are mapped copy-on-write, so changing them never
+        changes the files.
+        """
+        manifest = Data.read_binary_manifest(dirpath)
+        READ_VARS = set()
+        for kind in ('float', 'int'):
+            varnames = manifest[f'{kind}_vars']
+            if not varnames:
+                continue
+            block = np.load(os.path.join(dirpath, f'{kind}_vars.npy'),
+                            mmap_mode='c')
+            for varname, row in zip(varnames, block):
+                if varname in self.USABLE_READ_VARS:
+                    READ_VARS.add(varname)
+                    if kind == 'float' and row.dtype != self._float_dtype:
+                        row = row.astype(self._float_dtype)
+                    setattr(self, varname, row)
+                else:
+                    self.IGNORED_VARS.add(varname)
+        return READ_VARS, pd.RangeIndex(manifest['array_length'])
 
     def zero_out_changing_calculated_vars(self):
         """
@@ -285,6 +704,12 @@ class Data():
             return
         if isinstance(weights, pd.DataFrame):
             WT = weights
+        elif isinstance(weights, str) and os.path.isdir(weights):
+            manifest = Data.read_binary_manifest(weights)
+            WT = pd.DataFrame(
+                np.load(os.path.join(weights, 'weights.npy'), mmap_mode='r'),
+                columns=manifest['weights_columns']
+            )
         elif isinstance(weights, str):
             if os.path.isfile(weights):
                 WT = pd.read_csv(weights)
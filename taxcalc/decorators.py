@@ -8,9 +8,17 @@ of Tax-Calculator functions in the calcfunctions.py module.
 
 import os
 import io
+import sys
 import ast
+import hashlib
 import inspect
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import numpy as np
 import numba
+import taxcalc
 from taxcalc.policy import Policy
 
 
@@ -39,12 +47,91 @@ def id_wrapper(*dec_args, **dec_kwargs):  # pylint: disable=unused-argument
     return wrap
 
 
+# Setting the TAXCALCJITCACHE environment variable to a directory name
+# (before importing taxcalc) turns on persistent caching of the compiled
+# calc-style and apply-style functions.  The compiled code is written to
+# a subdirectory whose name contains the taxcalc and numba versions, and
+# is reloaded (rather than recompiled) by later processes.  Use the
+# "tc --warmup" command to fill the cache, for example in a container image.
+JIT_CACHE_DIR = None
+
 if DO_JIT is False or "NOTAXCALCJIT" in os.environ:
     JIT = id_wrapper
+elif os.environ.get("TAXCALCJITCACHE"):
+    JIT_CACHE_DIR = os.path.join(
+        os.path.abspath(os.environ["TAXCALCJITCACHE"]),
+        f"taxcalc-{taxcalc.__version__}-numba-{numba.__version__}"
+    )
+    os.environ.setdefault("NUMBA_CACHE_DIR",
+                          os.path.join(JIT_CACHE_DIR, "numba"))
+    numba.config.CACHE_DIR = os.environ["NUMBA_CACHE_DIR"]
+    JIT = functools.partial(numba.jit, cache=True)
 else:
     JIT = numba.jit
 
 
+# Number of threads used to apply each jitted function to contiguous
+# chunks of the records; the default value of one can be changed by
+# setting the TAXCALCNUMTHREADS environment variable or (for calculations
+# done by one Calculator object) by using its num_threads argument.
+# Because each filing unit is calculated independently of all others,
+# results do not depend on the number of threads.
+NUM_THREADS = int(os.environ.get("TAXCALCNUMTHREADS", "1"))
+MIN_CHUNK_SIZE = 1000  # smallest number of records in a chunk
+_EXECUTOR = {}  # maps number of threads to a ThreadPoolExecutor
+
+
+@contextlib.contextmanager
+def using_threads(nthreads):
+    """
+    Context manager that sets NUM_THREADS to nthreads (unless nthreads
+    is None) and restores the prior value on exit.
+    """
+    global NUM_THREADS  # pylint: disable=global-statement
+    prior = NUM_THREADS
+    if nthreads is not None:
+        assert nthreads >= 1, "number of threads must be at least one"
+        NUM_THREADS = nthreads
+    try:
+        yield
+    finally:
+        NUM_THREADS = prior
+
+
+def apply_in_chunks(applied_f, arrays, is_record):
+    """
+    Call applied_f with the specified arrays, splitting those arrays
+    that are records variables (as indicated by is_record) into
+    NUM_THREADS contiguous chunks that are processed by separate threads.
+    This is useful only when applied_f is jitted with nogil=True.
+
+    Returns
+    -------
+    value returned by applied_f when called with unsplit arrays;
+    otherwise, None
+    """
+    size = len(arrays[is_record.index(True)])
+    nchunks = min(NUM_THREADS, size // MIN_CHUNK_SIZE)
+    if nchunks <= 1:
+        return applied_f(*arrays)
+    if nchunks not in _EXECUTOR:
+        _EXECUTOR[nchunks] = ThreadPoolExecutor(max_workers=nchunks)
+    bounds = np.linspace(0, size, nchunks + 1).astype(int)
+
+    def apply_chunk(chunk):
+        """
+        apply_chunk function nested in apply_in_chunks function.
+        """
+        lo_ix = bounds[chunk]
+        hi_ix = bounds[chunk + 1]
+        applied_f(*[arr[lo_ix:hi_ix] if rec else arr
+                    for arr, rec in zip(arrays, is_record)])
+
+    # list() waits for all chunks and re-raises any exception
+    list(_EXECUTOR[nchunks].map(apply_chunk, range(nchunks)))
+    return None
+
+
 class GetReturnNode(ast.NodeVisitor):
     """
     A NodeVisitor to get the return tuple names from a calc-style function.
@@ -161,6 +248,57 @@ def create_toplevel_function_string(args_out, args_in, pm_or_pf):
     return fstr.getvalue()
 
 
+@functools.lru_cache(maxsize=None)
+def _source_file_hash(path):
+    """
+    Return hash of the contents of the source file with specified path.
+    """
+    with open(path, "rb") as sfile:
+        return hashlib.sha256(sfile.read()).hexdigest()
+
+
+def cached_apply_function_module(func, apfunc):
+    """
+    Write the apply-style function source string, apfunc, to a module file
+    in the JIT cache directory and return that imported module.  Unlike
+    a function created by compiling a string, a function defined in a
+    module file can be compiled by numba with cache=True.
+
+    Parameters
+    ----------
+    func: the calc-style function called by the apply-style function
+
+    apfunc: string containing the apply-style function source code
+
+    Returns
+    -------
+    module containing the apply-style function named ap_func
+    """
+    # the module name depends on the source of func's module (including
+    # any helper functions func calls) and on the apply-style function
+    # source, so any change in either produces a new module and cache entry
+    src_hash = hashlib.sha256(
+        (_source_file_hash(inspect.getsourcefile(func)) + apfunc).encode()
+    ).hexdigest()[:16]
+    modname = f"ap_{func.__name__}_{src_hash}"
+    apdir = os.path.join(JIT_CACHE_DIR, "apply")
+    os.makedirs(apdir, exist_ok=True)
+    path = os.path.join(apdir, modname + ".py")
+    if not os.path.isfile(path):
+        # write then rename so that concurrent processes never read
+        # a partially written module file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as afile:
+            afile.write(apfunc)
+        os.replace(tmp_path, path)
+    spec = importlib.util.spec_from_file_location(modname, path)
+    module = importlib.util.module_from_spec(spec)
+    # numba can reload cached code only for functions in importable modules
+    sys.modules[modname] = module
+    spec.loader.exec_module(module)
+    return module
+
+
 def make_apply_function(func, out_args, in_args, parameters,
                         do_jit=DO_JIT, **kwargs):
     """
@@ -186,10 +324,16 @@ def make_apply_function(func, out_args, in_args, parameters,
     apply-style function
     """
     if do_jit:
+        # release the GIL so that chunks can be processed in parallel
+        kwargs = {"nogil": True, **kwargs}
         jitted_f = JIT(**kwargs)(func)
     else:
         jitted_f = func
     apfunc = create_apply_function_string(out_args, in_args, parameters)
+    if do_jit and JIT_CACHE_DIR:
+        module = cached_apply_function_module(func, apfunc)
+        module.jitted_f = jitted_f
+        return JIT(**kwargs)(module.ap_func)
     func_code = compile(apfunc, "<string>", "exec")
     fakeglobals = {}
     eval(func_code,  # pylint: disable=eval-used
@@ -199,6 +343,29 @@ def make_apply_function(func, out_args, in_args, parameters,
     return fakeglobals["ap_func"]
 
 
+def make_chunked_apply_function(applied_f, out_args, in_args, parameters):
+    """
+    Takes an apply-style function and returns a function with the same
+    arguments and return value that uses apply_in_chunks to call it.
+    """
+    is_record = [arg not in parameters for arg in out_args + in_args]
+    nout = len(out_args)
+
+    def chunked_f(*arrays):
+        """
+        chunked_f function nested in make_chunked_apply_function.
+        """
+        ans = apply_in_chunks(applied_f, arrays, is_record)
+        if ans is not None:
+            return ans
+        # the apply-style function returns its output arrays
+        if nout == 1:
+            return arrays[0]
+        return arrays[:nout]
+
+    return chunked_f
+
+
 def apply_jit(dtype_sig_out, dtype_sig_in, parameters=None, **kwargs):
     """
     Make a decorator that takes in a calc-style function, handle apply step.
@@ -295,6 +462,15 @@ def iterate_jit(parameters=None, **kwargs):
                                                parameters=all_parameters,
                                                do_jit=DO_JIT,
                                                **kwargs_for_jit)
+        applied_jitted_f = make_chunked_apply_function(
+            applied_jitted_f, all_out_args, in_args, all_parameters
+        )
+
+        # Cache of high-level functions keyed by the pm_or_pf tuple,
+        # which records whether each argument is found in the first (pm)
+        # or second (pf) object, so that each distinct hl_func is compiled
+        # only once rather than on every call of the wrapper function
+        high_level_fns = {}
 
         def wrapper(*args, **kwargs):
             """
@@ -305,27 +481,34 @@ def iterate_jit(parameters=None, **kwargs):
             if os.getenv("TESTING") == "True":
                 return func(*args, **kwargs)
 
-            in_arrays = []
             pm_or_pf = []
             for farg in all_out_args + in_args:
                 if hasattr(args[0], farg):
-                    in_arrays.append(getattr(args[0], farg))
                     pm_or_pf.append("pm")
                 elif hasattr(args[1], farg):
-                    in_arrays.append(getattr(args[1], farg))
                     pm_or_pf.append("pf")
-            # Create the high level function
-            high_level_func = create_toplevel_function_string(all_out_args,
-                                                              list(in_args),
-                                                              pm_or_pf)
-            func_code = compile(high_level_func, "<string>", "exec")
-            fakeglobals = {}
-            eval(func_code,  # pylint: disable=eval-used
-                 {"applied_f": applied_jitted_f}, fakeglobals)
-            high_level_fn = fakeglobals["hl_func"]
+            pm_or_pf = tuple(pm_or_pf)
+            high_level_fn = high_level_fns.get(pm_or_pf)
+            if high_level_fn is None:
+                # Create the high level function
+                high_level_func = create_toplevel_function_string(
+                    all_out_args, list(in_args), pm_or_pf
+                )
+                func_code = compile(high_level_func, "<string>", "exec")
+                fakeglobals = {}
+                eval(func_code,  # pylint: disable=eval-used
+                     {"applied_f": applied_jitted_f}, fakeglobals)
+                high_level_fn = fakeglobals["hl_func"]
+                high_level_fns[pm_or_pf] = high_level_fn
             ans = high_level_fn(*args, **kwargs)
             return ans
 
+        # Remember the calc-style function and its argument lists so that
+        # other code (such as the fused calc_all kernel) can use them
+        wrapper.calc_function = func
+        wrapper.in_args = list(in_args)
+        wrapper.out_args = list(all_out_args)
+        wrapper.parameters = all_parameters
         return wrapper
 
     return make_wrapper
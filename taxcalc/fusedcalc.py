@@ -0,0 +1,249 @@
+"""
+Tax-Calculator fused calc_all logic that does all the tax calculations
+for each filing unit in a single (possibly jitted) loop over the records.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle fusedcalc.py
+# pylint --disable=locally-disabled fusedcalc.py
+
+import io
+import numpy as np
+import pandas as pd
+from taxcalc.decorators import JIT, apply_in_chunks
+from taxcalc.calcfunctions import (TaxInc, SchXYZTax, GainsTax, AGIsurtax,
+                                   NetInvIncTax, AMT, EI_PayrollTax, Adj,
+                                   DependentCare, ALD_InvInc_ec_base,
+                                   CapGainsLoss, AGIIncome,
+                                   SSBenefits, UBI, AGI, MiscDed,
+                                   ItemDed, StdDed, AdditionalMedicareTax,
+                                   F2441, EITC, RefundablePayrollTaxCredit,
+                                   ChildDepTaxCredit, AdditionalCTC, CTC_new,
+                                   PersonalTaxCredit, SchR,
+                                   AmOppCreditParts, EducationTaxCredit,
+                                   CharityCredit,
+                                   NonrefundableCredits, C1040, IITAX,
+                                   FairShareTax, LumpSumTax,
+                                   ExpandIncome, AfterTaxIncome,
+                                   BENEFIT_PROGRAMS)
+
+
+# Special steps in the CALC_ALL_STEPS list that are not calc-style functions
+BENEFITS_STEP = 'BenefitPrograms'
+ITEMIZATION_STEP = 'itemization'
+
+# Functions called (three times) by Calculator._taxinc_to_amt method
+TAXINC_TO_AMT_FUNCTIONS = [TaxInc, SchXYZTax, GainsTax, AGIsurtax,
+                           NetInvIncTax, AMT]
+
+# Steps in the same order as in the Calculator.calc_all method
+CALC_ALL_STEPS = [
+    UBI, BENEFITS_STEP,
+    # begin steps in Calculator._calc_one_year method
+    EI_PayrollTax, DependentCare, Adj, ALD_InvInc_ec_base, CapGainsLoss,
+    AGIIncome, SSBenefits, AGI, MiscDed, ItemDed, AdditionalMedicareTax,
+    StdDed, ITEMIZATION_STEP,
+    F2441, EITC, RefundablePayrollTaxCredit, PersonalTaxCredit,
+    AmOppCreditParts, SchR, EducationTaxCredit, CharityCredit,
+    ChildDepTaxCredit, NonrefundableCredits, AdditionalCTC, C1040,
+    CTC_new, IITAX,
+    # end steps in Calculator._calc_one_year method
+    FairShareTax, LumpSumTax, ExpandIncome, AfterTaxIncome
+]
+
+# Itemized deduction variables handled by the itemization step
+ITEMIZED_DEDUCTION_VARIABLES = ['c04470', 'c21060', 'c21040',
+                                'c17000', 'c18300', 'c19200',
+                                'c19700', 'c20500', 'c20800']
+
+# Tolerance used to detect equal standard and itemized tax amounts
+ITEMIZATION_TIE_TOLERANCE = 0.01  # one cent
+
+
+def _call_string(calcfunc, fname):
+    """
+    Return line of kernel source code that calls calcfunc, which is
+    known in the kernel as fname, for filing unit i.
+    """
+    outs = ','.join(f'r_{var}[i]' for var in calcfunc.out_args)
+    ins = []
+    for var in calcfunc.in_args:
+        if var in calcfunc.parameters:
+            ins.append(f'p_{var}')
+        else:
+            ins.append(f'r_{var}[i]')
+    return f'        {outs} = {fname}({",".join(ins)})\n'
+
+
+def create_fused_function_string():
+    """
+    Create a string for the fused calc_all kernel function of the form::
+
+       def fused_calc(r_a, r_b, ..., p_x, p_y, ..., c_z, ...):
+           for i in range(len(r_a)):
+               r_c[i], r_d[i] = f_0(r_a[i], p_x, ...)
+               ...
+
+    where r_ arguments are Records arrays, p_ arguments are Policy
+    parameter values, and c_ arguments are Consumption parameter values.
+
+    Returns
+    -------
+    tuple containing the kernel source string, the list of kernel
+    argument names, and a dictionary of the calc-style functions called
+    in the kernel (with keys being the names used in the kernel)
+    """
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    records_vars = []
+    policy_params = []
+    consump_params = []
+
+    def use(varlist, var):
+        if var not in varlist:
+            varlist.append(var)
+
+    for step in CALC_ALL_STEPS:
+        if step == BENEFITS_STEP:
+            for name, repeal, value in BENEFIT_PROGRAMS:
+                use(records_vars, name)
+                if repeal is not None:
+                    use(policy_params, repeal)
+                if value is not None:
+                    use(consump_params, value)
+            use(records_vars, 'benefit_cost_total')
+            use(records_vars, 'benefit_value_total')
+            continue
+        if step == ITEMIZATION_STEP:
+            funcs = TAXINC_TO_AMT_FUNCTIONS
+            for var in ITEMIZED_DEDUCTION_VARIABLES + ['standard', 'c05800']:
+                use(records_vars, var)
+        else:
+            funcs = [step]
+        for func in funcs:
+            for var in func.out_args + func.in_args:
+                if var in func.parameters:
+                    use(policy_params, var)
+                else:
+                    use(records_vars, var)
+    fnames = {}
+    for step in CALC_ALL_STEPS + TAXINC_TO_AMT_FUNCTIONS:
+        if callable(step):
+            fnames[step.calc_function.__name__] = step
+    args = ([f'r_{var}' for var in records_vars] +
+            [f'p_{var}' for var in policy_params] +
+            [f'c_{var}' for var in consump_params])
+
+    def taxinc_to_amt_lines():
+        return ''.join(_call_string(func, func.calc_function.__name__)
+                       for func in TAXINC_TO_AMT_FUNCTIONS)
+
+    fstr = io.StringIO()
+    fstr.write(f'def fused_calc({", ".join(args)}):\n')
+    fstr.write(f'    for i in range(len(r_{records_vars[0]})):\n')
+    for step in CALC_ALL_STEPS:
+        if step == BENEFITS_STEP:
+            # same logic and summation order as BenefitPrograms function
+            cost = '0.'
+            value = '0.'
+            for name, repeal, vparam in BENEFIT_PROGRAMS:
+                if repeal is not None:
+                    fstr.write(f'        if p_{repeal}:\n')
+                    fstr.write(f'            r_{name}[i] = 0.\n')
+                cost += f' + r_{name}[i]'
+                if vparam is None:
+                    value += f' + r_{name}[i]'
+                else:
+                    value += f' + r_{name}[i] * c_{vparam}'
+            fstr.write(f'        r_benefit_cost_total[i] = {cost}\n')
+            fstr.write(f'        r_benefit_value_total[i] = {value}\n')
+        elif step == ITEMIZATION_STEP:
+            # same logic as in the Calculator._calc_one_year method
+            fstr.write('        std = r_standard[i]\n')
+            for var in ITEMIZED_DEDUCTION_VARIABLES:
+                fstr.write(f'        item_{var} = r_{var}[i]\n')
+                fstr.write(f'        r_{var}[i] = 0.\n')
+            fstr.write(taxinc_to_amt_lines())
+            fstr.write('        std_taxes = r_c05800[i]\n')
+            fstr.write('        r_standard[i] = 0.\n')
+            for var in ITEMIZED_DEDUCTION_VARIABLES:
+                fstr.write(f'        r_{var}[i] = item_{var}\n')
+            fstr.write(taxinc_to_amt_lines())
+            fstr.write('        item_taxes = r_c05800[i]\n')
+            fstr.write(
+                '        if (abs(item_taxes - std_taxes) < '
+                f'{ITEMIZATION_TIE_TOLERANCE} and std_taxes > 0.):\n'
+            )
+            fstr.write('            itemizing = item_c04470 > std\n')
+            fstr.write('        else:\n')
+            fstr.write('            itemizing = item_taxes < std_taxes\n')
+            fstr.write('        if itemizing:\n')
+            fstr.write('            r_standard[i] = 0.\n')
+            for var in ITEMIZED_DEDUCTION_VARIABLES:
+                fstr.write(f'            r_{var}[i] = item_{var}\n')
+            fstr.write('        else:\n')
+            fstr.write('            r_standard[i] = std\n')
+            for var in ITEMIZED_DEDUCTION_VARIABLES:
+                fstr.write(f'            r_{var}[i] = 0.\n')
+            fstr.write(taxinc_to_amt_lines())
+        else:
+            fname = step.calc_function.__name__  # pylint: disable=no-member
+            fstr.write(_call_string(step, fname))
+    return fstr.getvalue(), args, fnames
+
+
+_FUSED_KERNEL = None
+_FUSED_ARGS = None
+
+
+def _fused_kernel():
+    """
+    Return fused calc_all kernel and its argument names, which are
+    created (and possibly jitted) on the first call of this function.
+    """
+    # pylint: disable=global-statement
+    global _FUSED_KERNEL, _FUSED_ARGS
+    if _FUSED_KERNEL is None:
+        kernel_str, args, fnames = create_fused_function_string()
+        kglobals = {
+            fname: JIT(nopython=True, nogil=True)(func.calc_function)
+            for fname, func in fnames.items()
+        }
+        func_code = compile(kernel_str, '<string>', 'exec')
+        fakeglobals = {}
+        eval(func_code, kglobals, fakeglobals)  # pylint: disable=eval-used
+        _FUSED_KERNEL = JIT(nopython=True, nogil=True)(
+            fakeglobals['fused_calc']
+        )
+        _FUSED_ARGS = args
+    return _FUSED_KERNEL, _FUSED_ARGS
+
+
+def fused_calc_all(policy, records, consumption):
+    """
+    Do all the calc_all calculations for the current year in one fused
+    loop over the records, updating the records arrays in place.  The
+    loop is split into chunks processed by separate threads when
+    decorators.NUM_THREADS is greater than one.  The results are identical
+    to those produced by the sequence of separate whole-array function
+    calls in the Calculator.calc_all method.
+    """
+    kernel, args = _fused_kernel()
+    benefit_names = set(name for name, _, _ in BENEFIT_PROGRAMS)
+    values = []
+    is_record = []
+    for arg in args:
+        kind, name = arg[0], arg[2:]
+        is_record.append(kind == 'r')
+        if kind == 'r':
+            val = getattr(records, name)
+            if isinstance(val, pd.Series):
+                val = val.values
+            elif not val.flags.writeable and name in benefit_names:
+                # kernel may zero out a shared read-only benefit array
+                val = val.copy()
+                setattr(records, name, val)
+            values.append(val)
+        elif kind == 'p':
+            values.append(getattr(policy, name)[0])
+        else:
+            values.append(np.float64(getattr(consumption, name)[0]))
+    apply_in_chunks(kernel, values, is_record)
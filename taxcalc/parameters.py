@@ -1,10 +1,12 @@
 """
 Tax-Calculator abstract base parameter class based on paramtools package.
 """
+# pylint: disable=too-many-lines
 
 import os
 import copy
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import Union, Mapping, Any, List
 import numpy as np
 import marshmallow
@@ -85,6 +87,8 @@ class Parameters(paramtools.Parameters):
                  removed=None, redefined=None, wage_indexed=None, **kwargs):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
 
+        self._year_values = None
+        self._flagged_params = set()
         # In case we need to wait for this to be called from the
         # initialize method for legacy reasons.
         if not start_year or not num_years:
@@ -164,7 +168,7 @@ class Parameters(paramtools.Parameters):
 
         """
         if print_warnings:
-            _data = copy.deepcopy(self._data)
+            _data = self._copy_data()
             kwargs['ignore_warnings'] = False
         else:
             kwargs['ignore_warnings'] = True
@@ -201,8 +205,131 @@ class Parameters(paramtools.Parameters):
                 params_or_path, raise_errors=True, **kwargs
             )
             self._warnings = _warnings
+            self._flagged_params |= self._params_with_messages()
             return adjustment
 
+    @contextmanager
+    def transaction(self, defer_validation=True, raise_errors=False,
+                    ignore_warnings=False):
+        """
+        Roll back any changes to parameter values when an exception is
+        raised in the context block, as the paramtools transaction method
+        does.  Unlike that method, the deferred validation at the end of
+        the block covers only the parameters whose values changed in the
+        block, the parameters whose validators refer to those changed
+        parameters, and the parameters with values that caused warnings
+        or errors in earlier adjustments.  The values of all other
+        parameters were valid before the block and are unchanged by it.
+        """
+        _data = self._copy_data()
+        _ops = dict(self.operators)
+        _state = dict(self.view_state())
+        try:
+            self._defer_validation = defer_validation
+            yield self
+        except Exception as exc:
+            self._data = _data
+            raise exc
+        finally:
+            self._state = _state
+            self._ops = _ops  # pylint: disable=attribute-defined-outside-init
+            self._defer_validation = False
+        if defer_validation:
+            self._validate_changes(_data, raise_errors, ignore_warnings)
+
+    def _delete_values(self, to_delete):
+        """
+        Delete the specified value objects, which were selected from the
+        current values of each parameter, without the paramtools delete
+        method, which rebuilds its value indexes after each deletion and
+        is very slow when many value objects are deleted.
+        """
+        def labels(vo):
+            return tuple(sorted(
+                (label, value) for label, value in vo.items()
+                if label not in ('value', '_auto')
+            ))
+
+        for param, vos in to_delete.items():
+            drop = {labels(vo) for vo in vos}
+            values = self._data[param]['value']
+            values[:] = [vo for vo in values if labels(vo) not in drop]
+            self.sel._cache.pop(param, None)
+        self._set_state(params=to_delete.keys())
+
+    def _copy_data(self):
+        """
+        Return copy of self._data that is unaffected by adjustments,
+        which replace or change only the value lists, the value objects
+        and the indexed status of parameters.  This is much faster than
+        a deep copy of self._data.
+        """
+        return {
+            param: dict(data, value=[
+                dict(vo, value=list(vo['value']))
+                if isinstance(vo['value'], list) else dict(vo)
+                for vo in data['value']
+            ])
+            for param, data in self._data.items()
+        }
+
+    def _validate_changes(self, data_before, raise_errors, ignore_warnings):
+        """
+        Validate the values of the parameters that may have been made
+        invalid by changes made since self._data was equal to data_before.
+        """
+        changed = {
+            param for param, data in self._data.items()
+            if data != data_before.get(param)
+        }
+        to_validate = changed | self._flagged_params
+        for param, data in self._data.items():
+            if param not in to_validate:
+                refs = Parameters._related_params(data.get('validators'))
+                if refs & changed:
+                    to_validate.add(param)
+        params = {}
+        for param in self._validator_schema.fields:
+            if param in to_validate:
+                # select values in their self._data order
+                self.sel._cache.pop(param, None)
+                result = self.select_eq(param, False)
+                if result:
+                    params[param] = result
+        try:
+            self.validate(params, raise_errors=raise_errors,
+                          ignore_warnings=ignore_warnings)
+        finally:
+            if not ignore_warnings:
+                self._flagged_params -= set(params)
+            self._flagged_params |= self._params_with_messages()
+
+    @staticmethod
+    def _related_params(validators):
+        """
+        Return set of all strings in the specified validators dictionary,
+        which include the names of any parameters the validators refer to.
+        """
+        if isinstance(validators, dict):
+            validators = list(validators.values())
+        if isinstance(validators, list):
+            related = set()
+            for item in validators:
+                related |= Parameters._related_params(item)
+            return related
+        if isinstance(validators, str):
+            return {validators}
+        return set()
+
+    def _params_with_messages(self):
+        """
+        Return set of names of parameters with warning or error messages.
+        """
+        params = set()
+        for messages in [self._warnings, self._errors]:
+            params |= set(messages.get('messages', {}))
+        return params & set(self._data)
+
     def adjust_with_indexing(self, params_or_path, **kwargs):
         """
         Adjust parameter values with the following indexing logic:
@@ -275,6 +402,7 @@ class Parameters(paramtools.Parameters):
                 {'parameter_indexing_CPI_offset':
                  params['parameter_indexing_CPI_offset']}, **kwargs
             )
+            needs_reset.append('parameter_indexing_CPI_offset')
             # turn off extend now that parameter_indexing_CPI_offset
             # has been updated.
             self.label_to_extend = None
@@ -319,7 +447,7 @@ class Parameters(paramtools.Parameters):
                         self.sel[param]['year'] > cpi_min_year['year']
                     )
                     needs_reset.append(param)
-            self.delete(to_delete, **kwargs)
+            self._delete_values(to_delete)
 
             # 1.b For all others, these are years after last_known_year.
             # last_known_year=max(cpi_min_year["year"],self._last_known_year)
@@ -374,6 +502,12 @@ class Parameters(paramtools.Parameters):
                 if self._data[param].get('indexed', False):
                     # pylint: disable=singleton-comparison
                     to_delete[param] = self.sel[param]['_auto'] == True
+                    if param not in long_param_vals:
+                        # extended values in earlier years do not depend on
+                        # inflation rates changed by the CPI offset
+                        to_delete[param] &= (
+                            self.sel[param]['year'] > cpi_min_year['year']
+                        )
                     # pylint warning message:
                     #   Comparison 'self.sel[param]['_auto'] == True' should
                     #   be 'self.sel[param]['_auto'] is True' if checking for
@@ -384,7 +518,7 @@ class Parameters(paramtools.Parameters):
                     # pylint: enable=singleton-comparison
                     needs_reset.append(param)
 
-            self.delete(to_delete, **kwargs)
+            self._delete_values(to_delete)
 
             self.extend(label='year')
 
@@ -477,7 +611,9 @@ class Parameters(paramtools.Parameters):
         # Re-instate ops.
         self.label_to_extend = label_to_extend
         self.array_first = array_first
-        self.set_state()
+        if needs_reset:
+            # reset only the attributes of parameters changed above
+            self._set_state(params=set(needs_reset))
 
         # Filter out "-indexed" params.
         nonindexed_params = {
@@ -674,8 +810,95 @@ class Parameters(paramtools.Parameters):
         )
 
     def set_year(self, year):
-        """Specify parameter year"""
-        self.set_state(year=year)
+        """
+        Specify parameter year.
+
+        When the only label in the state is year, the parameter attributes
+        are set from dense per-year value arrays, which are built from the
+        parameter values after each change in those values, so that
+        switching years does not call the expensive set_state method.
+        """
+        if (
+                not self.array_first or
+                not set(self._state).issubset({'year'})
+        ):
+            self.set_state(year=year)
+            return
+        year_values = self._dense_year_values()
+        idx = year_values['index'].get(year)
+        if idx is None:
+            self.set_state(year=year)  # raises error for invalid year
+            return
+        year = year_values['years'][idx]
+        self._state['year'] = [year]
+        self.label_grid['year'] = [year]
+        for name, values in year_values['values'].items():
+            setattr(self, name, values[idx:idx + 1].copy())
+
+    def _set_state(self, params=None, **labels):
+        """
+        Discard dense per-year values, which may be made obsolete by
+        parameter value changes that are always followed by a call of
+        this paramtools method, before setting the state.
+        """
+        self._year_values = None
+        super()._set_state(params=params, **labels)
+
+    def _dense_year_values(self):
+        """
+        Return dictionary containing the list of years, a year-to-index
+        dictionary, and a dictionary of parameter value arrays whose
+        first dimension is year, building it if necessary.
+        """
+        year_values = getattr(self, '_year_values', None)
+        if year_values is not None:
+            return year_values
+        years = list(self._stateless_label_grid['year'])
+        values = {}
+        for name in self._data:
+            values[name] = self._dense_values(name, years)
+        year_values = {
+            'years': years,
+            'index': {year: idx for idx, year in enumerate(years)},
+            'values': values,
+        }
+        self._year_values = year_values
+        return year_values
+
+    def _dense_values(self, name, years):
+        """
+        Return array of values for the named parameter over specified years
+        that is identical to the value of to_array(name, year=years).
+        """
+        vos = self._data[name]['value']
+        labels = [
+            label for label in self._stateless_label_grid
+            if vos and label in vos[0]
+        ]
+        if (
+                not labels or labels[0] != 'year' or
+                self._data[name].get('number_dims', 0) > 0
+        ):
+            return self.to_array(name, year=years)
+        grid = dict(self._stateless_label_grid, year=years)
+        index = [
+            {val: idx for idx, val in enumerate(grid[label])}
+            for label in labels
+        ]
+        shape = tuple(len(grid[label]) for label in labels)
+        arr = np.empty(shape, dtype=self._numpy_type(name))
+        filled = np.zeros(shape, dtype=np.bool_)
+        for vo in vos:
+            ix = tuple(lindex.get(vo[label])
+                       for label, lindex in zip(labels, index))
+            if None in ix or filled[ix]:
+                # unusual value objects are handled by paramtools
+                return self.to_array(name, year=years)
+            arr[ix] = vo['value']
+            filled[ix] = True
+        if not filled.all():
+            return self.to_array(name, year=years)
+        return arr
 
     @property
     def current_year(self):
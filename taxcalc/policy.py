@@ -6,7 +6,9 @@ Tax-Calculator federal tax policy Policy class.
 # pylint --disable=locally-disabled policy.py
 
 import os
+import copy
 import json
+import hashlib
 import paramtools
 from taxcalc.parameters import Parameters
 from taxcalc.growfactors import GrowFactors
@@ -36,6 +38,16 @@ class Policy(Parameters):
     Returns
     -------
     class instance: Policy
+
+    Notes
+    -----
+    Building the current-law parameter values from the JSON defaults file
+    is expensive, so a Policy constructed without keyword arguments is
+    restored from an in-process snapshot of a previously built instance
+    whenever the defaults file contents, the price-inflation and
+    wage-growth rates in gfactors, and last_budget_year are unchanged.
+    When any of these inputs differ, the full construction is done and
+    a new snapshot is saved.
     """
 
     DEFAULTS_FILE_NAME = 'policy_current_law.json'
@@ -155,6 +167,10 @@ class Policy(Parameters):
     # (3) specify which Policy parameters are wage (rather than price) indexed
     WAGE_INDEXED_PARAMS = ['SS_Earnings_c', 'SS_Earnings_thd']
 
+    # in-process snapshots of fully built Policy objects keyed by content
+    MAX_SNAPSHOTS = 4
+    _snapshots = {}
+
     def __init__(self,
                  gfactors=None,
                  last_budget_year=LAST_BUDGET_YEAR,
@@ -168,6 +184,12 @@ class Policy(Parameters):
             self._gfactors = gfactors
         else:
             raise ValueError('gfactors is not None or a GrowFactors instance')
+        # restore from snapshot when the same inputs were used before
+        key = None
+        if not kwargs and self.__class__ is Policy:
+            key = self._snapshot_key(last_budget_year)
+            if self._restore_snapshot(key):
+                return
         # read default parameters and initialize
         syr = Policy.JSON_START_YEAR
         nyrs = Policy.number_of_years(last_budget_year)
@@ -177,6 +199,54 @@ class Policy(Parameters):
                         Policy.REMOVED_PARAMS,
                         Policy.REDEFINED_PARAMS,
                         Policy.WAGE_INDEXED_PARAMS, **kwargs)
+        if key is not None:
+            self._save_snapshot(key)
+
+    def _snapshot_key(self, last_budget_year):
+        """
+        Return hash of the contents of the inputs (including the class
+        attributes that control parameter handling) used to build a Policy
+        object without keyword arguments.
+        """
+        path = os.path.join(Policy.DEFAULTS_FILE_PATH,
+                            Policy.DEFAULTS_FILE_NAME)
+        sha = hashlib.sha256()
+        with open(path, 'rb') as jfile:
+            sha.update(jfile.read())
+        rates = self._gfactors.gfdf[['ACPIU', 'AWAGE']]
+        sha.update(rates.index.to_numpy().tobytes())
+        sha.update(rates.to_numpy().tobytes())
+        sha.update(repr((
+            last_budget_year, Policy.JSON_START_YEAR, Policy.LAST_KNOWN_YEAR,
+            sorted(Policy.REMOVED_PARAMS.items()),
+            sorted(Policy.REDEFINED_PARAMS.items()),
+            Policy.WAGE_INDEXED_PARAMS
+        )).encode('utf-8'))
+        return sha.hexdigest()
+
+    def _restore_snapshot(self, key):
+        """
+        Set state of self from snapshot with specified key and return True,
+        or return False if there is no such snapshot.
+        """
+        snapshot = Policy._snapshots.get(key)
+        if snapshot is None:
+            return False
+        # references to snapshot (e.g., in validator schema) become self
+        gfactors = self._gfactors
+        memo = {id(snapshot): self,
+                id(snapshot.__dict__['_gfactors']): gfactors}
+        self.__dict__.update(copy.deepcopy(snapshot.__dict__, memo))
+        gfactors.used = True  # as set_rates would have done
+        return True
+
+    def _save_snapshot(self, key):
+        """
+        Save a copy of newly built self as snapshot with specified key.
+        """
+        if len(Policy._snapshots) >= Policy.MAX_SNAPSHOTS:
+            del Policy._snapshots[next(iter(Policy._snapshots))]
+        Policy._snapshots[key] = copy.deepcopy(self)
 
     @staticmethod
     def read_json_reform(obj):
@@ -80,6 +80,16 @@ class Records(Data):
         use a 1.0 weights_scale value.
         default value is 0.01.
 
+    columnar: boolean
+        specifies whether or not the variable arrays are stored as views
+        of a few contiguous two-dimensional blocks (see Data class);
+        default value is False.
+
+    float32: boolean
+        specifies whether or not the float variable arrays are stored in
+        single precision (see Data class);
+        default value is False.
+
     Raises
     ------
     ValueError:
@@ -127,12 +137,15 @@ class Records(Data):
                  weights=None,
                  adjust_ratios=None,
                  exact_calculations=False,
-                 weights_scale=0.01):
-        # pylint: disable=too-many-positional-arguments
+                 weights_scale=0.01,
+                 columnar=False,
+                 float32=False):
+        # pylint: disable=too-many-positional-arguments,too-many-locals
         # pylint: disable=no-member,too-many-branches
         if isinstance(weights, str):
             weights = os.path.join(Records.CODE_PATH, weights)
-        super().__init__(data, start_year, gfactors, weights, weights_scale)
+        super().__init__(data, start_year, gfactors, weights, weights_scale,
+                         columnar, float32)
         if data is None:
             return  # because there are no data
         # read adjustment ratios
@@ -202,7 +215,9 @@ class Records(Data):
     def cps_constructor(
             data=None,
             gfactors=GrowFactors(),
-            exact_calculations=False
+            exact_calculations=False,
+            columnar=False,
+            float32=False
     ):
         """
         Static method returns a Records object instantiated with CPS
@@ -223,6 +238,8 @@ class Records(Data):
             adjust_ratios=None,
             exact_calculations=exact_calculations,
             weights_scale=0.01,
+            columnar=columnar,
+            float32=float32,
         )
 
     @staticmethod
@@ -231,13 +248,16 @@ class Records(Data):
             gfactors=GrowFactors(),
             weights='puf_weights.csv.gz',
             ratios='puf_ratios.csv',
-            exact_calculations=False
+            exact_calculations=False,
+            columnar=False,
+            float32=False
     ):  # pragma: no cover
         """
         Static method returns a Records object instantiated with PUF
         input data.  This is a convenience method that eliminates the
         need to specify all the details of the PUF input data.
         """
+        # pylint: disable=too-many-positional-arguments
         assert isinstance(data, str)
         assert isinstance(gfactors, GrowFactors)
         assert isinstance(weights, str)
@@ -250,6 +270,8 @@ class Records(Data):
             adjust_ratios=pd.read_csv(ratios, index_col=0).transpose(),
             exact_calculations=exact_calculations,
             weights_scale=0.01,
+            columnar=columnar,
+            float32=float32,
         )
 
     @staticmethod
@@ -258,12 +280,15 @@ class Records(Data):
             weights_path: Path,
             growfactors: Path | GrowFactors,
             exact_calculations=False,
+            columnar=False,
+            float32=False,
     ):  # pragma: no cover
         """
         Static method returns a Records object instantiated with TMD
         input data.  This is a convenience method that eliminates the
         need to specify all the details of the TMD input data.
         """
+        # pylint: disable=too-many-positional-arguments
         assert isinstance(data_path, Path)
         assert isinstance(weights_path, Path)
         if isinstance(growfactors, Path):
@@ -278,6 +303,50 @@ class Records(Data):
             adjust_ratios=None,
             exact_calculations=exact_calculations,
             weights_scale=1.0,
+            columnar=columnar,
+            float32=float32,
+        )
+
+    @staticmethod
+    def binary_constructor(
+            dirpath,
+            gfactors=GrowFactors(),
+            adjust_ratios=None,
+            exact_calculations=False,
+            columnar=False,
+            float32=False
+    ):
+        """
+        Static method returns a Records object instantiated with the data
+        and weights in a binary directory written by the Records.write_binary
+        method, for example, like this::
+
+            Records.write_binary('cps_binary',
+                                 data=os.path.join(Records.CODE_PATH,
+                                                   'cps.csv.gz'),
+                                 start_year=Records.CPSCSV_YEAR,
+                                 weights=os.path.join(Records.CODE_PATH,
+                                                      'cps_weights.csv.gz'))
+            rec = Records.binary_constructor('cps_binary')
+
+        The start_year and weights_scale are read from the directory's
+        manifest.  The gfactors argument is ignored if the directory
+        contains no weights.
+        """
+        # pylint: disable=too-many-positional-arguments
+        dirpath = os.path.abspath(dirpath)
+        manifest = Data.read_binary_manifest(dirpath)
+        has_weights = manifest['weights_columns'] is not None
+        return Records(
+            data=dirpath,
+            start_year=manifest['start_year'],
+            gfactors=gfactors if has_weights else None,
+            weights=dirpath if has_weights else None,
+            adjust_ratios=adjust_ratios,
+            exact_calculations=exact_calculations,
+            weights_scale=manifest['weights_scale'],
+            columnar=columnar,
+            float32=float32,
         )
 
     def increment_year(self):
@@ -286,9 +355,14 @@ class Records(Data):
         extrapolation, reweighting, adjusting for new current year.
         """
         super().increment_year()
-        self.FLPDYR[:] = self.current_year  # pylint: disable=no-member
-        # apply variable adjustment ratios
-        self._adjust(self.current_year)
+        self._change_inputs(self._set_year_and_adjust, self.current_year)
+
+    def _set_year_and_adjust(self, year):
+        """
+        Set FLPDYR to specified year and apply variable adjustment ratios.
+        """
+        self.FLPDYR[:] = year  # pylint: disable=no-member
+        self._adjust(year)
 
     @staticmethod
     def read_cps_data():
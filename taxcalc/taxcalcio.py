@@ -357,9 +357,12 @@ class TaxCalcIO():
             self.recs_ref = self._make_records(
                 gfactors_ref, input_data, tax_year, exact_calculations,
             )
-            self.recs_bas = self._make_records(
-                gfactors_bas, input_data, tax_year, exact_calculations,
-            )
+            if gdiff_response.has_any_response():
+                self.recs_bas = self._make_records(
+                    gfactors_bas, input_data, tax_year, exact_calculations,
+                )
+            else:  # gfactors_bas and gfactors_ref are the same
+                self.recs_bas = self.recs_ref.shared_copy()
             # extrapolate input data to tax_year
             while self.recs_ref.current_year < tax_year:
                 self.recs_ref.increment_year()
@@ -368,7 +371,7 @@ class TaxCalcIO():
             self.recs_ref = self._make_records(
                 None, input_data, tax_year, exact_calculations,
             )
-            self.recs_bas = copy.deepcopy(self.recs_ref)
+            self.recs_bas = self.recs_ref.shared_copy()
         # create Calculator objects
         self.calc_ref = self._make_calculator(
             self.pol_ref, self.recs_ref, not self.silent,
@@ -184,6 +184,102 @@ def test_calculator_mtr(cps_subsample, full_claiming_assumption):
     assert np.allclose(calc.array('c00100'), c00100x)
 
 
+def test_calculator_mtr_many(cps_subsample):
+    """
+    Test Calculator mtr_many method gives same results as mtr method.
+    """
+    rec = tc.Records.cps_constructor(data=cps_subsample)
+    calc = tc.Calculator(policy=tc.Policy(), records=rec)
+    calc.calc_all()
+    combined = calc.array('combined').copy()
+    variables = ['e00200p', 'e00200s', 'e00650', 'k1bx14p', 'p23250']
+    mtrs = calc.mtr_many(variables=variables, calc_all_already_called=True)
+    assert list(mtrs.keys()) == variables
+    assert np.allclose(calc.array('combined'), combined)
+    for var in variables:
+        expected = calc.mtr(variable_str=var, calc_all_already_called=True)
+        for mtr_many_array, mtr_array in zip(mtrs[var], expected):
+            assert np.allclose(mtr_many_array, mtr_array, equal_nan=True)
+    assert len(calc.mtr_many()) == len(tc.Calculator.MTR_VALID_VARIABLES)
+    with pytest.raises(ValueError):
+        calc.mtr_many(variables=['e00200p', 'bad_income_type'])
+
+
+def test_calculator_store_restore_records(cps_subsample):
+    """
+    Test Calculator store_records and restore_records methods.
+    """
+    rec = tc.Records.cps_constructor(data=cps_subsample)
+    calc = tc.Calculator(policy=tc.Policy(), records=rec)
+    calc.calc_all()
+    allvars = sorted(rec.USABLE_READ_VARS | rec.CALCULATED_VARS)
+    before = {var: calc.array(var).copy() for var in allvars}
+    e00200 = calc.array('e00200')
+    calc.store_records()
+    calc.array('e00200p', calc.array('e00200p') + 1000.)
+    calc.incarray('e00200', np.full(calc.array_len, 1000.))
+    calc.incarray('e00200', np.full(calc.array_len, 1000.))
+    calc.calc_all()
+    assert not np.allclose(calc.array('iitax'), before['iitax'])
+    calc.restore_records()
+    assert calc.array('e00200') is e00200
+    for var in allvars:
+        assert np.array_equal(calc.array(var), before[var]), var
+
+
+def test_columnar_records(cps_subsample):
+    """
+    Test Calculator results are same with columnar Records storage.
+    """
+    rec = tc.Records.cps_constructor(data=cps_subsample)
+    crec = tc.Records.cps_constructor(data=cps_subsample, columnar=True)
+    assert not rec.columnar
+    assert crec.columnar
+    assert crec.e00200.base is crec.e00300.base
+    assert crec.c00100.base is crec.iitax.base
+    calc = tc.Calculator(policy=tc.Policy(), records=rec)
+    ccalc = tc.Calculator(policy=tc.Policy(), records=crec)
+    for clc in (calc, ccalc):
+        clc.advance_to_year(2020)
+        clc.calc_all()
+    assert ccalc.array('e00200').base is ccalc.array('e00300').base
+    assert ccalc.array('iitax').base is ccalc.array('c00100').base
+    (_, _, mtr) = calc.mtr(calc_all_already_called=True)
+    (_, _, cmtr) = ccalc.mtr(calc_all_already_called=True)
+    assert np.allclose(mtr, cmtr)
+    assert ccalc.array('iitax').base is ccalc.array('c00100').base
+    dframe = calc.dataframe(None, all_vars=True)
+    cdframe = ccalc.dataframe(None, all_vars=True)
+    assert sorted(dframe.columns) == sorted(cdframe.columns)
+    assert np.allclose(dframe[sorted(dframe.columns)],
+                       cdframe[sorted(dframe.columns)])
+
+
+def test_float32_records(cps_subsample):
+    """
+    Test single-precision Records and Calculator float32_accuracy_report.
+    """
+    rec = tc.Records.cps_constructor(data=cps_subsample, float32=True)
+    assert rec.float_dtype == np.float32
+    assert rec.e00200.dtype == np.float32
+    assert rec.c00100.dtype == np.float32
+    assert rec.MARS.dtype == np.int32
+    pol = tc.Policy()
+    pol.implement_reform({'II_rt7': {2020: 0.40}})
+    calc = tc.Calculator(policy=pol, records=rec)
+    calc.advance_to_year(2020)
+    (aggregates, table_diff) = calc.float32_accuracy_report()
+    assert list(aggregates.index) == ['iitax', 'payrolltax', 'combined']
+    assert list(aggregates.columns) == ['float64', 'float32',
+                                        'abs_diff', 'rel_diff']
+    assert np.allclose(aggregates['rel_diff'], 0., atol=1e-5)
+    assert aggregates.loc['iitax', 'float64'] > 0.
+    assert table_diff.shape == calc.distribution_tables(
+        None, 'weighted_deciles')[0].shape
+    assert calc.array('iitax').dtype == np.float32
+    assert np.allclose(calc.array('iitax'), 0.)  # calc_all not called
+
+
 def test_make_calculator_increment_years_first(cps_subsample):
     """
     Test Calculator inflation indexing of policy parameters.
@@ -855,6 +951,54 @@ def test_calc_all_benefits_amounts(cps_subsample):
     assert np.allclose(ubi_diff, benefit_value_diff)
 
 
+def test_fused_calc_all(cps_subsample):
+    """
+    Test that fused calc_all produces results identical to unfused calc_all
+    """
+    pol = tc.Policy()
+    pol.implement_reform({
+        'BEN_snap_repeal': {2020: True},
+        'UBI_21': {2020: 1000},
+        'STD': {2020: [4000, 8000, 4000, 6000, 8000]},
+        'II_rt7': {2020: 0.45},
+    })
+    consump = tc.Consumption()
+    consump.update_consumption({'BEN_housing_value': {2020: 0.5}})
+    recs = tc.Records.cps_constructor(data=cps_subsample)
+    calc1 = tc.Calculator(policy=pol, records=recs, consumption=consump)
+    calc2 = tc.Calculator(policy=pol, records=recs, consumption=consump,
+                          fused=True)
+    calc1.advance_to_year(2020)
+    calc2.advance_to_year(2020)
+    calc1.calc_all()
+    calc2.calc_all()
+    assert calc1.weighted_total('c04470') > 0.
+    for varname in recs.USABLE_READ_VARS | recs.CALCULATED_VARS:
+        assert np.array_equal(calc1.array(varname), calc2.array(varname),
+                              equal_nan=True), varname
+
+
+def test_calc_all_num_threads(cps_subsample):
+    """
+    Test that multi-threaded calc_all produces results identical to
+    single-threaded calc_all for both the unfused and fused calculations
+    """
+    pol = tc.Policy()
+    recs = tc.Records.cps_constructor(data=cps_subsample)
+    calc1 = tc.Calculator(policy=pol, records=recs)
+    calc1.calc_all()
+    for fused in [False, True]:
+        calc2 = tc.Calculator(policy=pol, records=recs, fused=fused,
+                              num_threads=3)
+        calc2.calc_all()
+        for varname in recs.USABLE_READ_VARS | recs.CALCULATED_VARS:
+            assert np.array_equal(calc1.array(varname),
+                                  calc2.array(varname),
+                                  equal_nan=True), varname
+    with pytest.raises(ValueError):
+        tc.Calculator(policy=pol, records=recs, num_threads=0)
+
+
 def test_cg_top_rate():
     """
     Test top CG bracket and rate.
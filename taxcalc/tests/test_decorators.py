@@ -6,7 +6,9 @@ Test decorators.
 # pylint --disable=locally-disabled test_decorators.py
 
 import os
+import glob
 import importlib
+import numba
 import numpy as np
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
@@ -245,6 +247,56 @@ def test_ret_everything_iterate_jit():
     assert_frame_equal(ans, exp)
 
 
+@iterate_jit(nopython=True)
+def magic_calc_cached(x, y, z):
+    """Function docstring"""
+    a = x + y
+    b = x + y + z
+    return (a, b)
+
+
+def test_iterate_jit_reuses_high_level_function(monkeypatch):
+    """
+    Check that the high-level function is compiled on the first call
+    only and then reused on subsequent calls with the same pm/pf layout.
+    """
+    pm = Foo()
+    pf = Foo()
+    pf.a = np.ones((5,))
+    pf.b = np.ones((5,))
+    pf.x = np.ones((5,))
+    pf.y = np.ones((5,))
+    pf.z = np.ones((5,))
+    ans1 = magic_calc_cached(pm, pf)
+
+    compiled_layouts = []
+
+    def counting_toplevel_function_string(args_out, args_in, pm_or_pf):
+        """Function docstring"""
+        compiled_layouts.append(tuple(pm_or_pf))
+        return create_toplevel_function_string(args_out, args_in, pm_or_pf)
+
+    monkeypatch.setattr(taxcalc.decorators,
+                        'create_toplevel_function_string',
+                        counting_toplevel_function_string)
+    ans2 = magic_calc_cached(pm, pf)
+    assert_frame_equal(ans1, ans2)
+    assert not compiled_layouts
+    # a different pm/pf layout requires a newly compiled function
+    pm.a = np.ones((1, 5))
+    pm.b = np.ones((1, 5))
+    del pf.a
+    del pf.b
+    ans3 = magic_calc_cached(pm, pf)
+    assert_frame_equal(ans1, ans3)
+    assert compiled_layouts == [('pm', 'pm', 'pf', 'pf', 'pf')]
+    # which is then reused on the next call with that layout
+    pm.a = np.ones((1, 5))
+    pm.b = np.ones((1, 5))
+    magic_calc_cached(pm, pf)
+    assert len(compiled_layouts) == 1
+
+
 @iterate_jit(nopython=True)
 def magic_calc3(x, y, z):
     """Function docstring"""
@@ -387,3 +439,72 @@ def test_force_no_jit():
     # restore normal JIT operation of decorators module
     del os.environ['NOTAXCALCJIT']
     importlib.reload(taxcalc.decorators)
+
+
+def test_jit_cache(tmp_path, monkeypatch):
+    """
+    Check that setting the TAXCALCJITCACHE environment variable causes
+    the apply-style function and its numba-compiled code to be written
+    to the on-disk JIT cache directory.
+    """
+    numba_cache_dir = numba.config.CACHE_DIR
+    monkeypatch.setenv('TAXCALCJITCACHE', str(tmp_path))
+    monkeypatch.delenv('NUMBA_CACHE_DIR', raising=False)
+    importlib.reload(taxcalc.decorators)
+    try:
+        cache_dir = taxcalc.decorators.JIT_CACHE_DIR
+        assert cache_dir.startswith(str(tmp_path))
+        assert taxcalc.__version__ in cache_dir
+        magic_calc6_ = taxcalc.decorators.iterate_jit(
+            parameters=['w'], nopython=True
+        )(magic_calc6)
+        pm = Foo()
+        pf = Foo()
+        pm.a = np.ones((1, 5))
+        pm.b = np.ones((1, 5))
+        pm.w = np.ones((1, 5))
+        pf.x = np.ones((5,))
+        pf.y = np.ones((5,))
+        pf.z = np.ones((5,))
+        ans = magic_calc6_(pm, pf)
+        exp = DataFrame(data=[[2.0, 4.0]] * 5,
+                        columns=['a', 'b'])
+        assert_frame_equal(ans, exp)
+        apfiles = glob.glob(
+            os.path.join(cache_dir, 'apply', 'ap_magic_calc6_*.py')
+        )
+        assert len(apfiles) == 1
+        index_files = glob.glob(
+            os.path.join(cache_dir, 'numba', '**', '*.nbi'), recursive=True
+        )
+        assert index_files
+    finally:
+        # restore normal JIT operation of decorators module
+        monkeypatch.undo()
+        numba.config.CACHE_DIR = numba_cache_dir
+        importlib.reload(taxcalc.decorators)
+
+
+def test_apply_in_chunks(monkeypatch):
+    """
+    Check that using several threads to apply an iterate_jit function to
+    contiguous chunks of the records gives the same results as one thread.
+    """
+    monkeypatch.setattr(taxcalc.decorators, 'MIN_CHUNK_SIZE', 2)
+    pm = Foo()
+    pf = Foo()
+    pm.w = np.ones((1, 5))
+    pf.x = np.arange(11.)
+    pf.y = np.arange(11.) * 2.
+    pf.z = np.ones((11,))
+    pf.a = np.zeros((11,))
+    pf.b = np.zeros((11,))
+    exp = magic_calc5(pm, pf)  # pylint: disable=no-value-for-parameter
+    pf.a = np.zeros((11,))
+    pf.b = np.zeros((11,))
+    with taxcalc.decorators.using_threads(4):
+        assert taxcalc.decorators.NUM_THREADS == 4
+        ans = magic_calc5(pm, pf)  # pylint: disable=no-value-for-parameter
+    assert taxcalc.decorators.NUM_THREADS == 1
+    assert_frame_equal(ans, exp)
+    assert np.array_equal(pf.b, pf.x + pf.y + pf.z + 1.)
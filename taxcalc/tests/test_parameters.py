@@ -668,3 +668,37 @@ def test_compatible_data_presence():
         for pname in problem_pnames:
             print(msg.format(pname))
         assert False, "ERROR: list of problem_pnames is above"
+
+
+def test_set_year_dense_values():
+    """
+    Test that set_year using dense per-year parameter values produces the
+    same state and parameter values as the paramtools set_state method,
+    both before and after a reform is implemented.
+    """
+    pol1 = Policy()
+    pol2 = Policy()
+    reform = {
+        'II_em': {2020: 1000},
+        'STD-indexed': {2022: False},
+        'CTC_include17': {2021: True},
+    }
+    for pol in [pol1, pol2]:
+        pol.set_year(2019)
+        pol.implement_reform(reform)
+    for year in range(pol1.start_year, pol1.end_year + 1):
+        pol1.set_state(year=year)
+        pol2.set_year(year)
+        assert pol2.current_year == year
+        assert pol2.view_state() == pol1.view_state()
+        for param in pol1.keys():
+            val1 = getattr(pol1, param)
+            val2 = getattr(pol2, param)
+            assert val2.dtype == val1.dtype
+            assert np.array_equal(val2, val1)
+    with pytest.raises(paramtools.ValidationError):
+        pol2.set_year(pol2.end_year + 1)
+    consump = Consumption()
+    consump.update_consumption({'MPC_e20400': {2014: 0.05}})
+    consump.set_year(2015)
+    assert consump.MPC_e20400 == [0.05]
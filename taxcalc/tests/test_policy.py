@@ -14,6 +14,7 @@ import numpy as np
 import pytest
 import paramtools
 from taxcalc.policy import Policy
+from taxcalc.growfactors import GrowFactors
 
 
 def cmp_policy_objs(pol1, pol2, year_range=None, exclude=None):
@@ -1578,3 +1579,39 @@ def test_ext_plus_odc2_reform(tests_path):
         ref.set_year(year)
         assert np.allclose([ref.ODC_c], [exp_odc_c_ref[year]])
         assert np.allclose([ref.ACTC_c], [exp_actc_c_ref[year]])
+
+
+def test_policy_snapshot(monkeypatch):
+    """
+    Test that Policy objects restored from an in-process snapshot equal
+    fully built Policy objects and that changed inputs cause a full build.
+    """
+    builds = []
+    initialize = Policy.initialize
+
+    def counting_initialize(self, *args, **kwargs):
+        builds.append(1)
+        return initialize(self, *args, **kwargs)
+
+    monkeypatch.setattr(Policy, '_snapshots', {})
+    monkeypatch.setattr(Policy, 'initialize', counting_initialize)
+    pol1 = Policy()
+    pol2 = Policy()
+    assert len(builds) == 1
+    assert pol2._validator_schema.pt_context['spec'] is pol2
+    cmp_policy_objs(pol1, pol2)
+    # changes to a restored object do not affect later objects
+    pol2.implement_reform({'STD': {2027: [1000] * 5}})
+    pol3 = Policy()
+    assert len(builds) == 1
+    cmp_policy_objs(pol1, pol3)
+    # changed growfactors cause a full build
+    gfactors = GrowFactors()
+    gfactors.update('ACPIU', 2030, 0.01)
+    pol4 = Policy(gfactors=gfactors)
+    assert len(builds) == 2
+    assert pol4.inflation_rates() != pol3.inflation_rates()
+    assert gfactors.used
+    # changed last_budget_year causes a full build
+    Policy(last_budget_year=Policy.LAST_BUDGET_YEAR - 1)
+    assert len(builds) == 3
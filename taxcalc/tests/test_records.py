@@ -201,6 +201,66 @@ def test_read_data(csv):
         Records(data=df)
 
 
+def test_records_shared_copy(cps_subsample):
+    """
+    Test that shared_copy Records share read-only input arrays, including
+    the arrays extrapolated to a later year, but not calculated arrays.
+    """
+    rec = Records.cps_constructor(data=cps_subsample)
+    rec_private = Records.cps_constructor(data=cps_subsample)
+    rec1 = rec.shared_copy()
+    rec2 = rec.shared_copy()
+    assert rec1.e00200 is rec2.e00200
+    assert rec1.c00100 is not rec2.c00100
+    with pytest.raises(ValueError):
+        rec1.e00200[0] = 1.0
+    for _ in range(3):
+        rec1.increment_year()
+        rec_private.increment_year()
+    rec2.e00300 = rec2.e00300 + 1.0  # replaced array is not shared
+    for _ in range(3):
+        rec2.increment_year()
+    for _ in range(3):
+        rec.increment_year()
+    assert rec.current_year == rec1.current_year == rec2.current_year
+    assert rec1.e00200 is rec.e00200
+    assert rec1.e00200 is not rec2.e00200
+    assert np.array_equal(rec1.e00200, rec2.e00200)
+    assert np.all(rec2.e00300 > rec1.e00300)
+    for varname in rec.USABLE_READ_VARS - {'s006'}:
+        assert np.array_equal(getattr(rec1, varname),
+                              getattr(rec_private, varname))
+
+
+def test_binary_records(cps_subsample, tmp_path):
+    """
+    Test that Records read from binary directory are same as those read
+    from CSV-style DataFrame.
+    """
+    wghts = pd.read_csv(os.path.join(Records.CODE_PATH, 'cps_weights.csv.gz'))
+    wghts = wghts.iloc[cps_subsample.index].reset_index(drop=True)
+    data = cps_subsample.reset_index(drop=True)
+    bdir = str(tmp_path / 'cps_binary')
+    Records.write_binary(bdir, data=data, start_year=Records.CPSCSV_YEAR,
+                         weights=wghts)
+    rec = Records(data=data, start_year=Records.CPSCSV_YEAR,
+                  gfactors=GrowFactors(), weights=wghts)
+    brec = Records.binary_constructor(bdir)
+    assert brec.data_year == rec.data_year
+    for _ in range(3):
+        rec.increment_year()
+        brec.increment_year()
+    for varname in rec.USABLE_READ_VARS | rec.CALCULATED_VARS:
+        assert np.allclose(getattr(brec, varname), getattr(rec, varname))
+    # check that extrapolation did not change the binary files
+    assert np.allclose(Records.binary_constructor(bdir).e00200, data.e00200)
+    with pytest.raises(ValueError):
+        Records.binary_constructor(str(tmp_path))
+    with pytest.raises(ValueError):
+        Records.write_binary(str(tmp_path / 'bad'), data=data,
+                             start_year='2014')
+
+
 @pytest.mark.param_var_count
 def test_for_duplicate_names():
     """Test docstring"""